@@ -3,31 +3,166 @@ Main test runner.
 Executes all tests and generates Excel report.
 """
 
+import argparse
+import functools
 import unittest
 import sys
 import os
+import shutil
+import tempfile
+import time
+import warnings
+import zipfile
+from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
 from datetime import datetime
+from traceback import format_exception
+from xml.sax.saxutils import escape, quoteattr
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.utils.datetime import to_excel
+from openpyxl.xml import LXML
+
+from utils import movegen_numba
 
 from .system.system_tests import TestChessGameSystem
 from .integration.integration_tests import TestChessGameIntegration
 from .unit.unit_tests import TestChessGameUnit
 
+# Report styles, created once and shared by every cell. Colors are
+# written as 8 digit ARGB with an opaque FF alpha, openpyxl pads 6 digit
+# colors with a 00 alpha
+HEADER_FONT = Font(bold=True, size=12, color="FFFFFFFF")
+HEADER_FILL = PatternFill(start_color="FF366092", end_color="FF366092", fill_type="solid")
+PASS_FILL = PatternFill(start_color="FFC6EFCE", end_color="FFC6EFCE", fill_type="solid")
+FAIL_FILL = PatternFill(start_color="FFFFC7CE", end_color="FFFFC7CE", fill_type="solid")
+ERROR_FILL = PatternFill(start_color="FFFFEB9C", end_color="FFFFEB9C", fill_type="solid")
+SKIP_FILL = PatternFill(start_color="FFE0E0E0", end_color="FFE0E0E0", fill_type="solid")
+SUMMARY_LABEL_FONT = Font(bold=True)
+
+# Fill of the Result column for each test result
+RESULT_FILL = {
+    'PASS': PASS_FILL,
+    'FAIL': FAIL_FILL,
+    'ERROR': ERROR_FILL,
+    'SKIP': SKIP_FILL,
+}
+
+CENTER_ALIGN = Alignment(horizontal="center", vertical="center")
+LEFT_ALIGN = Alignment(horizontal="left", vertical="top", wrap_text=True)
+
+THIN_SIDE = Side(style='thin')
+THIN_BORDER = Border(
+    left=THIN_SIDE,
+    right=THIN_SIDE,
+    top=THIN_SIDE,
+    bottom=THIN_SIDE
+)
+
+# Durations and timestamps are written as numbers and datetimes, Excel
+# shows them with these formats
+DURATION_FORMAT = '0.000'
+TIMESTAMP_FORMAT = 'yyyy-mm-dd hh:mm:ss'
+
+HEADERS = ['Test Case ID', 'Category', 'Test Name', 'Description',
+           'Result', 'Duration (s)', 'Timestamp', 'Error Message']
+
+COLUMN_WIDTHS = {
+    'A': 15,  # Test Case ID
+    'B': 12,  # Category
+    'C': 30,  # Test Name
+    'D': 50,  # Description
+    'E': 10,  # Result
+    'F': 12,  # Duration
+    'G': 20,  # Timestamp
+    'H': 60,  # Error Message
+}
+
+SUMMARY_COLUMN_WIDTHS = {'A': 20, 'B': 20}
+
+# Set to 1 to write the report's XML directly instead of through openpyxl
+FAST_XLSX_ENV = 'CHESS_FAST_XLSX'
+
+# Test classes run by run_tests, in report order
+TEST_CLASSES = (TestChessGameSystem, TestChessGameIntegration, TestChessGameUnit)
+
+# Reports with more rows than this warn when openpyxl can't use lxml
+LXML_WARNING_ROWS = 1000
+
+# Test category for each class name substring, checked in order
+CATEGORY_MAP = {
+    'System': 'SYSTEM',
+    'Integration': 'INTEGRATION',
+    'Unit': 'UNIT',
+}
 
-class ChessTestResult(unittest.TestResult):
+# (test_id, description, category) for each (test class, method name),
+# filled by load_test_meta or on a test's first result
+TEST_META = {}
+
+
+def _test_meta(test_class, method_name):
     """
-    Custom test result class to capture detailed information for Excel export.
-    Tracks each test case with its ID, description, result, and execution details.
+    Read a test method's report metadata.
+
+    Args:
+        test_class (type): TestCase subclass
+        method_name (str): Name of the test method
+
+    Returns:
+        tuple: (test_id, description, category), the ID and description
+               come from the test_case decorator's attributes and the
+               category from the class name
+    """
+    test_method = getattr(test_class, method_name)
+    test_id = getattr(test_method, 'test_id', 'TC-UNKNOWN')
+    description = getattr(test_method, 'test_description', method_name)
+    
+    # Determine test category from test class name
+    class_name = test_class.__name__
+    category = next((category for name, category in CATEGORY_MAP.items()
+                     if name in class_name), 'OTHER')
+    return test_id, description, category
+
+
+def load_test_meta(test_class, method_names):
+    """
+    Fill TEST_META for every test method of a class.
+
+    Args:
+        test_class (type): TestCase subclass
+        method_names (list): Names of its test methods
+    """
+    for method_name in method_names:
+        TEST_META[(test_class, method_name)] = _test_meta(test_class, method_name)
+
+
+class TestDetailResult(unittest.TestResult, ABC):
+    """
+    Test result that turns every test outcome into a detail dict.
+    Each detail holds the test case ID, description, result and execution
+    details, and is passed to write_detail, which subclasses implement.
+    Every test gives exactly one detail, failing subtests included.
     """
     def __init__(self):
         super().__init__()
-        self.test_details = []
-        
+        # (result, error message) of the current test's failing subtests
+        self._subtest_errors = []
+
     def startTest(self, test):
-        """Called when a test starts - capture start time."""
+        """
+        Called when a test starts - capture start time.
+
+        Durations are measured with time.perf_counter, datetime is only
+        used once per test for the report's timestamp, which is written
+        to the report as a datetime rather than formatted.
+        """
         super().startTest(test)
-        self.current_start_time = datetime.now()
+        self.current_start_time = time.perf_counter()
         
     def addSuccess(self, test):
         """Called when a test passes."""
@@ -50,32 +185,52 @@ class ChessTestResult(unittest.TestResult):
         """Called when a test is skipped."""
         super().addSkip(test, reason)
         self._add_test_detail(test, 'SKIP', reason)
-        
+
+    def addSubTest(self, test, subtest, err):
+        """
+        Called when a subTest block ends.
+
+        A test with a failing subtest never reaches addSuccess, so failing
+        subtests are kept until the test ends and folded into its detail.
+        """
+        super().addSubTest(test, subtest, err)
+        if err is not None:
+            result = 'FAIL' if issubclass(err[0], test.failureException) else 'ERROR'
+            error_msg = f"{subtest}\n{self._format_error(err)}"
+            self._subtest_errors.append((result, error_msg))
+
+    def stopTest(self, test):
+        """Called when a test ends, records a test that only failed in subtests."""
+        if self._subtest_errors:
+            self._add_test_detail(test, 'FAIL', '')
+        super().stopTest(test)
+
     def _add_test_detail(self, test, result, error_msg):
         """
-        Extract test details and add to results list.
+        Extract test details and pass them to write_detail.
         Looks for test_id and test_description attributes on test methods.
         """
+        duration = time.perf_counter() - self.current_start_time
         end_time = datetime.now()
-        duration = (end_time - self.current_start_time).total_seconds()
-        
-        # Get test case ID and description from test method attributes
-        test_method = getattr(test, test._testMethodName)
-        test_id = getattr(test_method, 'test_id', 'TC-UNKNOWN')
-        description = getattr(test_method, 'test_description', test._testMethodName)
+
+        # Failing subtests share their test's detail, any error makes it an ERROR
+        if self._subtest_errors:
+            results = [result] + [subtest_result for subtest_result, _ in self._subtest_errors]
+            result = 'ERROR' if 'ERROR' in results else 'FAIL'
+            messages = [message for _, message in self._subtest_errors]
+            if error_msg:
+                messages.append(error_msg)
+            error_msg = '\n'.join(messages)
+            self._subtest_errors = []
         
-        # Determine test category from test class name
-        class_name = test.__class__.__name__
-        if 'System' in class_name:
-            category = 'SYSTEM'
-        elif 'Integration' in class_name:
-            category = 'INTEGRATION'
-        elif 'Unit' in class_name:
-            category = 'UNIT'
-        else:
-            category = 'OTHER'
+        # Test case ID, description and category, looked up once per test method
+        key = (type(test), test._testMethodName)
+        meta = TEST_META.get(key)
+        if meta is None:
+            meta = TEST_META[key] = _test_meta(*key)
+        test_id, description, category = meta
         
-        self.test_details.append({
+        self.write_detail({
             'test_id': test_id,
             'category': category,
             'test_name': test._testMethodName,
@@ -83,128 +238,484 @@ class ChessTestResult(unittest.TestResult):
             'result': result,
             'error_message': error_msg,
             'duration': duration,
-            'timestamp': end_time.strftime('%Y-%m-%d %H:%M:%S')
+            'timestamp': end_time
         })
-        
+
+    @abstractmethod
+    def write_detail(self, detail):
+        """
+        Record one test detail.
+
+        Args:
+            detail (dict): Test detail with the keys built by _add_test_detail
+        """
+
     def _format_error(self, err):
         """Format error tuple into readable string."""
-        import traceback
-        return ''.join(traceback.format_exception(*err))
+        return ''.join(format_exception(*err))
 
 
-def generate_excel_report(test_result, output_path):
+class _DetailListResult(TestDetailResult):
     """
-    Generate Excel report from test results.
-    
+    Keeps the test details in a list, used in parallel worker processes
+    where the details are sent back to the main process.
+    """
+    def __init__(self):
+        super().__init__()
+        self.test_details = []
+
+    def write_detail(self, detail):
+        """Append one test detail to test_details."""
+        self.test_details.append(detail)
+
+
+def _run_test_class(test_class):
+    """
+    Run every test of one TestCase class, in a parallel worker process.
+
+    Only picklable values are returned, test objects are replaced by
+    their names.
+
     Args:
-        test_result: ChessTestResult object with test details
-        output_path: Path where Excel file should be saved
+        test_class (type): TestCase subclass to run
+
+    Returns:
+        tuple: (details, tests_run, failures, errors, skipped) for
+               ChessTestResult.merge
     """
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Test Results"
-    
-    # Define styles
-    header_font = Font(bold=True, size=12, color="FFFFFF")
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    pass_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-    fail_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-    error_fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-    skip_fill = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid")
-    
-    center_align = Alignment(horizontal="center", vertical="center")
-    left_align = Alignment(horizontal="left", vertical="top", wrap_text=True)
-    
-    thin_border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
+    result = _DetailListResult()
+    unittest.TestLoader().loadTestsFromTestCase(test_class).run(result)
+    return (
+        result.test_details,
+        result.testsRun,
+        [(str(test), text) for test, text in result.failures],
+        [(str(test), text) for test, text in result.errors],
+        [(str(test), reason) for test, reason in result.skipped],
     )
-    
-    # Define headers
-    headers = ['Test Case ID', 'Category', 'Test Name', 'Description', 
-               'Result', 'Duration (s)', 'Timestamp', 'Error Message']
-    
-    # Set column widths
-    ws.column_dimensions['A'].width = 15  # Test Case ID
-    ws.column_dimensions['B'].width = 12  # Category
-    ws.column_dimensions['C'].width = 30  # Test Name
-    ws.column_dimensions['D'].width = 50  # Description
-    ws.column_dimensions['E'].width = 10  # Result
-    ws.column_dimensions['F'].width = 12  # Duration
-    ws.column_dimensions['G'].width = 20  # Timestamp
-    ws.column_dimensions['H'].width = 60  # Error Message
-    
-    # Write headers
-    for col, header in enumerate(headers, start=1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = center_align
-        cell.border = thin_border
-    
-    # Write test data
-    for idx, test in enumerate(test_result.test_details, start=2):
-        # Test Case ID
-        cell = ws.cell(row=idx, column=1, value=test['test_id'])
-        cell.alignment = center_align
-        cell.border = thin_border
+
+
+class _OpenpyxlReport:
+    """
+    Writes the report with openpyxl in write-only mode, each row is
+    appended to the "Test Results" sheet as soon as it arrives.
+    """
+    def __init__(self):
+        self.workbook = Workbook(write_only=True)
+        self.worksheet = self.workbook.create_sheet("Test Results")
+        self._style_cache = {}
         
-        # Category
-        cell = ws.cell(row=idx, column=2, value=test['category'])
-        cell.alignment = center_align
-        cell.border = thin_border
+        # Column widths must be set before the first row is appended
+        for column, width in COLUMN_WIDTHS.items():
+            self.worksheet.column_dimensions[column].width = width
         
-        # Test Name
-        cell = ws.cell(row=idx, column=3, value=test['test_name'])
-        cell.alignment = left_align
-        cell.border = thin_border
+        # Write headers
+        self.worksheet.append([self._styled_cell(header, CENTER_ALIGN,
+                                                 HEADER_FILL, HEADER_FONT)
+                               for header in HEADERS])
+        self._next_row = 2
         
-        # Description
-        cell = ws.cell(row=idx, column=4, value=test['description'])
-        cell.alignment = left_align
-        cell.border = thin_border
+    def write_detail(self, detail):
+        """
+        Append one test detail to the "Test Results" sheet.
+
+        Args:
+            detail (dict): Test detail with the keys built by _add_test_detail
+        """
+        # Only rows with an error message get a taller row, the rest keep
+        # the default height. Row heights are only written if set before
+        # the row is appended
+        ws = self.worksheet
+        if detail['error_message']:
+            ws.row_dimensions[self._next_row].height = 60
+        self._next_row += 1
         
-        # Result with color coding
-        result = test['result']
-        cell = ws.cell(row=idx, column=5, value=result)
-        cell.alignment = center_align
-        cell.border = thin_border
-        if result == 'PASS':
-            cell.fill = pass_fill
-        elif result == 'FAIL':
-            cell.fill = fail_fill
-        elif result == 'ERROR':
-            cell.fill = error_fill
-        elif result == 'SKIP':
-            cell.fill = skip_fill
+        # The Result column is color coded
+        result = detail['result']
+        styled_cell = self._styled_cell
+        ws.append([
+            styled_cell(detail['test_id'], CENTER_ALIGN),
+            styled_cell(detail['category'], CENTER_ALIGN),
+            styled_cell(detail['test_name'], LEFT_ALIGN),
+            styled_cell(detail['description'], LEFT_ALIGN),
+            styled_cell(result, CENTER_ALIGN, RESULT_FILL.get(result)),
+            styled_cell(detail['duration'], CENTER_ALIGN, number_format=DURATION_FORMAT),
+            styled_cell(detail['timestamp'], CENTER_ALIGN, number_format=TIMESTAMP_FORMAT),
+            styled_cell(detail['error_message'], LEFT_ALIGN),
+        ])
+
+    def save(self, summary_data, output_path):
+        """
+        Add the "Summary" sheet and save the workbook.
+
+        A write-only workbook can only be saved once. openpyxl serializes
+        with lxml when it is installed, large reports warn when it isn't
+        since the pure Python writer is slower.
+
+        Args:
+            summary_data (list): [label, value] rows of the summary sheet
+            output_path: Path where Excel file should be saved
+        """
+        if not LXML and self._next_row - 2 > LXML_WARNING_ROWS:
+            warnings.warn("Install lxml for faster xlsx export")
         
-        # Duration
-        cell = ws.cell(row=idx, column=6, value=f"{test['duration']:.3f}")
-        cell.alignment = center_align
-        cell.border = thin_border
+        summary_ws = self.workbook.create_sheet(title="Summary")
+        for column, width in SUMMARY_COLUMN_WIDTHS.items():
+            summary_ws.column_dimensions[column].width = width
         
-        # Timestamp
-        cell = ws.cell(row=idx, column=7, value=test['timestamp'])
-        cell.alignment = center_align
-        cell.border = thin_border
+        for label, value in summary_data:
+            label_cell = WriteOnlyCell(summary_ws, value=label)
+            label_cell.font = SUMMARY_LABEL_FONT
+            summary_ws.append([label_cell, value])
         
-        # Error Message
-        cell = ws.cell(row=idx, column=8, value=test['error_message'])
-        cell.alignment = left_align
-        cell.border = thin_border
-        ws.row_dimensions[idx].height = 60 if test['error_message'] else 20
-    
-    # Add summary sheet
-    summary_ws = wb.create_sheet(title="Summary")
+        self.workbook.save(output_path)
+
+    def _styled_cell(self, value, alignment, fill=None, font=None, number_format=None):
+        """
+        Build a bordered write-only cell for the "Test Results" sheet.
+
+        Assigning a style makes openpyxl hash it to find its index in the
+        workbook, which is most of the cost of writing a row. The first cell
+        with a given style combination is styled normally and cached, later
+        cells copy its style indices the same way openpyxl copies cells
+        between worksheets.
+
+        Args:
+            value: Cell value
+            alignment: Alignment style
+            fill: Optional PatternFill
+            font: Optional Font
+            number_format (str): Optional Excel number format
+
+        Returns:
+            WriteOnlyCell: The styled cell
+        """
+        cell = WriteOnlyCell(self.worksheet, value=value)
+        key = (id(alignment), id(fill), id(font), number_format)
+        template = self._style_cache.get(key)
+        if template is not None:
+            cell._style = copy(template._style)
+            return cell
+
+        cell.alignment = alignment
+        cell.border = THIN_BORDER
+        if fill is not None:
+            cell.fill = fill
+        if font is not None:
+            cell.font = font
+        if number_format is not None:
+            cell.number_format = number_format
+        self._style_cache[key] = cell
+        return cell
+
+
+# Cell style indices in _XLSX_STYLES, used by _XmlReport
+_XF_HEADER = 1
+_XF_CENTER = 2
+_XF_LEFT = 3
+_XF_RESULT = {'PASS': 4, 'FAIL': 5, 'ERROR': 6, 'SKIP': 7}
+_XF_DURATION = 8
+_XF_TIMESTAMP = 9
+_XF_LABEL = 10
+
+_MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_PACKAGE_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml'
+_XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+
+def _xml_fill(fill):
+    """Serialize a solid PatternFill for styles.xml."""
+    return (f'<fill><patternFill patternType="{fill.fill_type}">'
+            f'<fgColor rgb="{fill.fgColor.rgb}"/><bgColor rgb="{fill.bgColor.rgb}"/>'
+            f'</patternFill></fill>')
+
+
+def _xml_xf(font_id=0, fill_id=0, border_id=0, num_fmt_id=0, alignment=None):
+    """Serialize one cellXfs entry for styles.xml."""
+    attrs = (f'numFmtId="{num_fmt_id}" fontId="{font_id}" fillId="{fill_id}" '
+             f'borderId="{border_id}" xfId="0"')
+    if alignment is None:
+        return f'<xf {attrs}/>'
+    wrap = ' wrapText="1"' if alignment.wrap_text else ''
+    return (f'<xf {attrs} applyAlignment="1"><alignment horizontal="{alignment.horizontal}" '
+            f'vertical="{alignment.vertical}"{wrap}/></xf>')
+
+
+# styles.xml, built from the same style constants as the openpyxl report.
+# Fonts: 0 default, 1 header, 2 summary label. Fills: 0 and 1 are the
+# two Excel requires, then header, pass, fail, error, skip. Borders: 0
+# none, 1 thin. The cellXfs order matches the _XF_* indices
+_XLSX_STYLES = (
+    _XML_DECLARATION
+    + f'<styleSheet xmlns="{_MAIN_NS}">'
+    + f'<numFmts count="2"><numFmt numFmtId="164" formatCode={quoteattr(DURATION_FORMAT)}/>'
+    + f'<numFmt numFmtId="165" formatCode={quoteattr(TIMESTAMP_FORMAT)}/></numFmts>'
+    + '<fonts count="3">'
+    + '<font><sz val="11"/><color theme="1"/><name val="Calibri"/><family val="2"/>'
+    + '<scheme val="minor"/></font>'
+    + f'<font><b val="1"/><sz val="{HEADER_FONT.sz:g}"/>'
+    + f'<color rgb="{HEADER_FONT.color.rgb}"/></font>'
+    + '<font><b val="1"/></font></fonts>'
+    + f'<fills count="{2 + 1 + len(RESULT_FILL)}">'
+    + '<fill><patternFill/></fill><fill><patternFill patternType="gray125"/></fill>'
+    + _xml_fill(HEADER_FILL)
+    + ''.join(_xml_fill(fill) for fill in RESULT_FILL.values())
+    + '</fills>'
+    + f'<borders count="2"><border><left/><right/><top/><bottom/><diagonal/></border>'
+    + f'<border><left style="{THIN_SIDE.style}"/><right style="{THIN_SIDE.style}"/>'
+    + f'<top style="{THIN_SIDE.style}"/><bottom style="{THIN_SIDE.style}"/></border>'
+    + '</borders>'
+    + '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    + '<cellXfs count="11">'
+    + _xml_xf()
+    + _xml_xf(font_id=1, fill_id=2, border_id=1, alignment=CENTER_ALIGN)
+    + _xml_xf(border_id=1, alignment=CENTER_ALIGN)
+    + _xml_xf(border_id=1, alignment=LEFT_ALIGN)
+    + ''.join(_xml_xf(fill_id=3 + i, border_id=1, alignment=CENTER_ALIGN)
+              for i in range(len(RESULT_FILL)))
+    + _xml_xf(border_id=1, num_fmt_id=164, alignment=CENTER_ALIGN)
+    + _xml_xf(border_id=1, num_fmt_id=165, alignment=CENTER_ALIGN)
+    + _xml_xf(font_id=2)
+    + '</cellXfs>'
+    + '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    + '</styleSheet>'
+)
+
+# Every part of the xlsx package except the two worksheets
+_XLSX_PARTS = {
+    '[Content_Types].xml': (
+        _XML_DECLARATION
+        + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        + '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        + '<Default Extension="xml" ContentType="application/xml"/>'
+        + f'<Override PartName="/xl/workbook.xml" ContentType="{_CONTENT_TYPE}.sheet.main+xml"/>'
+        + f'<Override PartName="/xl/worksheets/sheet1.xml" ContentType="{_CONTENT_TYPE}.worksheet+xml"/>'
+        + f'<Override PartName="/xl/worksheets/sheet2.xml" ContentType="{_CONTENT_TYPE}.worksheet+xml"/>'
+        + f'<Override PartName="/xl/styles.xml" ContentType="{_CONTENT_TYPE}.styles+xml"/>'
+        + '</Types>'
+    ),
+    '_rels/.rels': (
+        _XML_DECLARATION
+        + f'<Relationships xmlns="{_PACKAGE_REL_NS}">'
+        + f'<Relationship Id="rId1" Type="{_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+        + '</Relationships>'
+    ),
+    'xl/workbook.xml': (
+        _XML_DECLARATION
+        + f'<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}"><sheets>'
+        + '<sheet name="Test Results" sheetId="1" r:id="rId1"/>'
+        + '<sheet name="Summary" sheetId="2" r:id="rId2"/>'
+        + '</sheets></workbook>'
+    ),
+    'xl/_rels/workbook.xml.rels': (
+        _XML_DECLARATION
+        + f'<Relationships xmlns="{_PACKAGE_REL_NS}">'
+        + f'<Relationship Id="rId1" Type="{_REL_NS}/worksheet" Target="worksheets/sheet1.xml"/>'
+        + f'<Relationship Id="rId2" Type="{_REL_NS}/worksheet" Target="worksheets/sheet2.xml"/>'
+        + f'<Relationship Id="rId3" Type="{_REL_NS}/styles" Target="styles.xml"/>'
+        + '</Relationships>'
+    ),
+    'xl/styles.xml': _XLSX_STYLES,
+}
+
+_SHEET_END = '</sheetData></worksheet>'
+
+
+def _sheet_start(column_widths):
+    """
+    Serialize the start of a worksheet, up to the opening <sheetData>.
+
+    Args:
+        column_widths (dict): Column letter to width, in column order
+
+    Returns:
+        str: Worksheet XML before the first row
+    """
+    cols = ''.join(f'<col min="{index}" max="{index}" width="{width}" customWidth="1"/>'
+                   for index, width in enumerate(column_widths.values(), start=1))
+    return f'{_XML_DECLARATION}<worksheet xmlns="{_MAIN_NS}"><cols>{cols}</cols><sheetData>'
+
+
+def _xml_cell(ref, style, value):
+    """
+    Serialize one cell the way openpyxl's write-only mode does.
+
+    Strings are written inline, datetimes as Excel serial dates, and None
+    or empty strings as a styled cell with no value.
+
+    Args:
+        ref (str): Cell reference like 'A2'
+        style (int): Index into the cellXfs of _XLSX_STYLES
+        value: str, int, float, datetime or None
+
+    Returns:
+        str: The <c> element
+    """
+    if value is None:
+        return f'<c r="{ref}" s="{style}"/>'
+    if value == '':
+        return f'<c r="{ref}" s="{style}" t="inlineStr"/>'
+    if isinstance(value, str):
+        text = escape(ILLEGAL_CHARACTERS_RE.sub('', value))
+        return f'<c r="{ref}" s="{style}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+    if isinstance(value, datetime):
+        value = to_excel(value)
+    # Numbers are rounded to 16 significant digits like openpyxl does
+    return f'<c r="{ref}" s="{style}"><v>{value:.16g}</v></c>'
+
+
+class _XmlReport:
+    """
+    Writes the report's xlsx parts directly, without openpyxl cell objects.
+
+    The report has a fixed layout and a handful of styles, so the package
+    parts are static strings built once from the style constants above,
+    and each test row is formatted straight to sheet XML in a temporary
+    file. save zips everything together. The cells, styles and sizes
+    match _OpenpyxlReport's, except that characters XML can't hold are
+    dropped where openpyxl would raise.
+    """
+    def __init__(self):
+        self._rows = tempfile.TemporaryFile()
+        self._next_row = 2
+        self._write_row(1, ''.join(_xml_cell(f'{column}1', _XF_HEADER, header)
+                                   for column, header in zip(COLUMN_WIDTHS, HEADERS)))
+
+    def write_detail(self, detail):
+        """
+        Format one test detail as a row of the "Test Results" sheet.
+
+        Args:
+            detail (dict): Test detail with the keys built by _add_test_detail
+        """
+        row = self._next_row
+        self._next_row += 1
+        error_message = detail['error_message']
+        cells = (
+            _xml_cell(f'A{row}', _XF_CENTER, detail['test_id']),
+            _xml_cell(f'B{row}', _XF_CENTER, detail['category']),
+            _xml_cell(f'C{row}', _XF_LEFT, detail['test_name']),
+            _xml_cell(f'D{row}', _XF_LEFT, detail['description']),
+            _xml_cell(f'E{row}', _XF_RESULT.get(detail['result'], _XF_CENTER), detail['result']),
+            _xml_cell(f'F{row}', _XF_DURATION, detail['duration']),
+            _xml_cell(f'G{row}', _XF_TIMESTAMP, detail['timestamp']),
+            _xml_cell(f'H{row}', _XF_LEFT, error_message),
+        )
+        self._write_row(row, ''.join(cells), 60 if error_message else None)
+
+    def save(self, summary_data, output_path):
+        """
+        Write the "Summary" sheet and zip every part into the xlsx file.
+
+        Args:
+            summary_data (list): [label, value] rows of the summary sheet
+            output_path: Path where Excel file should be saved
+        """
+        summary_rows = ''.join(
+            f'<row r="{row}">{_xml_cell(f"A{row}", _XF_LABEL, label)}'
+            f'{_xml_cell(f"B{row}", 0, value)}</row>'
+            for row, (label, value) in enumerate(summary_data, start=1))
+        
+        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as package:
+            for name, content in _XLSX_PARTS.items():
+                package.writestr(name, content)
+            with package.open('xl/worksheets/sheet1.xml', 'w') as sheet:
+                sheet.write(_sheet_start(COLUMN_WIDTHS).encode('utf-8'))
+                self._rows.seek(0)
+                shutil.copyfileobj(self._rows, sheet)
+                sheet.write(_SHEET_END.encode('utf-8'))
+            package.writestr('xl/worksheets/sheet2.xml',
+                             _sheet_start(SUMMARY_COLUMN_WIDTHS) + summary_rows + _SHEET_END)
+        self._rows.close()
+
+    def _write_row(self, row, cells, height=None):
+        """Write one <row> element to the temporary sheet data file."""
+        if height is None:
+            self._rows.write(f'<row r="{row}">{cells}</row>'.encode('utf-8'))
+        else:
+            self._rows.write(f'<row r="{row}" ht="{height}" customHeight="1">{cells}</row>'
+                             .encode('utf-8'))
+
+
+class ChessTestResult(TestDetailResult):
+    """
+    Custom test result class to capture detailed information for Excel export.
+    Tracks each test case with its ID, description, result, and execution details.
+
+    Each detail is written to the report's "Test Results" sheet as soon as
+    its test finishes and only the result counts are kept.
+    generate_excel_report adds the summary and saves it. The report is
+    written with openpyxl, or directly as XML when the CHESS_FAST_XLSX
+    environment variable is set to 1.
+    """
+    def __init__(self):
+        super().__init__()
+        if os.environ.get(FAST_XLSX_ENV) == '1':
+            self.report = _XmlReport()
+        else:
+            self.report = _OpenpyxlReport()
+        self._counts = Counter()
+        
+    def write_detail(self, detail):
+        """
+        Write one test detail to the report and count its result.
+
+        Args:
+            detail (dict): Test detail with the keys built by _add_test_detail
+        """
+        self._counts[detail['result']] += 1
+        self.report.write_detail(detail)
+        
+    def merge(self, worker_result):
+        """
+        Add the outcome of tests run by _run_test_class in another process.
+
+        Failures, errors and skips are kept as (test name, text) pairs,
+        since the test objects stay in the worker.
+
+        Args:
+            worker_result (tuple): (details, tests_run, failures, errors,
+                                   skipped) as returned by _run_test_class
+        """
+        details, tests_run, failures, errors, skipped = worker_result
+        for detail in details:
+            self.write_detail(detail)
+        self.testsRun += tests_run
+        self.failures.extend(failures)
+        self.errors.extend(errors)
+        self.skipped.extend(skipped)
+
+    def result_counts(self):
+        """
+        Count the recorded test details by result.
+
+        Returns:
+            Counter: Number of details for each result ('PASS', 'FAIL',
+                     'ERROR', 'SKIP'), 0 for results that never occurred
+        """
+        return Counter(self._counts)
+
+
+def generate_excel_report(test_result, output_path):
+    """
+    Generate Excel report from test results.
+
+    The test rows were already written by test_result while the tests
+    ran, this adds the summary sheet and saves the report. The report
+    can only be saved once, so this is called once per result.
     
+    Args:
+        test_result: ChessTestResult object with test details
+        output_path: Path where Excel file should be saved
+    """
     # Calculate statistics
-    total = len(test_result.test_details)
-    passed = sum(1 for t in test_result.test_details if t['result'] == 'PASS')
-    failed = sum(1 for t in test_result.test_details if t['result'] == 'FAIL')
-    errors = sum(1 for t in test_result.test_details if t['result'] == 'ERROR')
-    skipped = sum(1 for t in test_result.test_details if t['result'] == 'SKIP')
+    counts = test_result.result_counts()
+    total = sum(counts.values())
+    passed = counts['PASS']
+    failed = counts['FAIL']
+    errors = counts['ERROR']
+    skipped = counts['SKIP']
     pass_rate = (passed / total * 100) if total > 0 else 0
     
     # Write summary
@@ -221,42 +732,74 @@ def generate_excel_report(test_result, output_path):
         ['Execution Date', datetime.now().strftime('%Y-%m-%d %H:%M:%S')]
     ]
     
-    for row_idx, (label, value) in enumerate(summary_data, start=1):
-        summary_ws.cell(row=row_idx, column=1, value=label).font = Font(bold=True)
-        summary_ws.cell(row=row_idx, column=2, value=value)
-    
-    summary_ws.column_dimensions['A'].width = 20
-    summary_ws.column_dimensions['B'].width = 20
-    
     # Save workbook
-    wb.save(output_path)
+    test_result.report.save(summary_data, output_path)
     print(f"\nExcel report saved to: {output_path}")
 
 
-def run_tests():
+@functools.lru_cache(maxsize=1)
+def _load_test_names():
     """
-    Main function to run all tests and generate Excel report.
+    Find the test methods of every class in TEST_CLASSES and read their
+    report metadata, once per process.
+
+    Returns:
+        tuple: (test class, tuple of test method names) pairs
     """
-    # Create test suite
     loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Add all test classes
-    suite.addTests(loader.loadTestsFromTestCase(TestChessGameSystem))
-    suite.addTests(loader.loadTestsFromTestCase(TestChessGameIntegration))
-    suite.addTests(loader.loadTestsFromTestCase(TestChessGameUnit))
-    
+    test_names = []
+    for test_class in TEST_CLASSES:
+        method_names = loader.getTestCaseNames(test_class)
+        load_test_meta(test_class, method_names)
+        test_names.append((test_class, tuple(method_names)))
+    return tuple(test_names)
+
+
+def _build_suite():
+    """
+    Build the suite of every test in TEST_CLASSES.
+
+    The method names are cached by _load_test_names, but the suite itself
+    is new on every call since a TestSuite drops its tests as they run.
+
+    Returns:
+        unittest.TestSuite: One test case per test method
+    """
+    return unittest.TestSuite(test_class(method_name)
+                              for test_class, method_names in _load_test_names()
+                              for method_name in method_names)
+
+
+def run_tests(parallel=False):
+    """
+    Main function to run all tests and generate Excel report.
+
+    Args:
+        parallel (bool): Run each test class in its own worker process.
+                         The classes share no state, but tests inside a
+                         class still run in order in one process.
+    """
+    # Compile the numba move generator up front so the first test
+    # using it isn't charged for the compile in its duration
+    movegen_numba.warmup()
+
     # Run tests with custom result class
     print("Running Chess Game Tests...\n")
     result = ChessTestResult()
-    suite.run(result)
+    if parallel:
+        workers = min(len(TEST_CLASSES), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for worker_result in executor.map(_run_test_class, TEST_CLASSES):
+                result.merge(worker_result)
+    else:
+        _build_suite().run(result)
     
     # Print summary to console
     print("\n" + "="*70)
     print("TEST EXECUTION SUMMARY")
     print("="*70)
     print(f"Total Tests: {result.testsRun}")
-    print(f"Passed: {len([t for t in result.test_details if t['result'] == 'PASS'])}")
+    print(f"Passed: {result.result_counts()['PASS']}")
     print(f"Failed: {len(result.failures)}")
     print(f"Errors: {len(result.errors)}")
     print(f"Skipped: {len(result.skipped)}")
@@ -275,6 +818,10 @@ def run_tests():
 
 
 if __name__ == '__main__':
-    result = run_tests()
+    parser = argparse.ArgumentParser(description="Run the chess tests and export an Excel report.")
+    parser.add_argument('--parallel', action='store_true',
+                        help="run each test class in its own process")
+    args = parser.parse_args()
+    result = run_tests(parallel=args.parallel)
     # Exit with error code if tests failed
     sys.exit(0 if result.wasSuccessful() else 1)
\ No newline at end of file
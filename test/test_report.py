@@ -0,0 +1,60 @@
+"""
+Tests for the test runner's Excel report
+
+These check the report writers in test/test.py rather than the chess code,
+so they are kept out of TEST_CLASSES and don't show up in the report they
+test. Run them with: python -m unittest test.test_report
+"""
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from openpyxl import load_workbook
+
+from test.test import _OpenpyxlReport, _XmlReport
+
+
+class TestExcelReport(unittest.TestCase):
+    """Tests for the report writers used by ChessTestResult."""
+
+    def test_xml_report_matches_openpyxl(self):
+        """
+        Test that _XmlReport and _OpenpyxlReport write the same workbook:
+        - Both reports load with openpyxl
+        - Cell values and number formats match on both sheets
+        """
+        timestamp = datetime(2026, 1, 2, 3, 4, 5)
+        details = [
+            {'test_id': f'TC-UNIT-{index:03d}', 'category': 'Unit Test',
+             'test_name': f'test_{index}', 'description': 'Compare <a> & "b"',
+             'result': result, 'error_message': '' if result == 'PASS' else 'Traceback\n  line 1',
+             'duration': 0.0125 * (index + 1),
+             'timestamp': timestamp + timedelta(seconds=index)}
+            for index, result in enumerate(('PASS', 'FAIL', 'ERROR', 'SKIP'))
+        ]
+        summary_data = [['Tests Run', 4], ['Pass Rate', '25.00%']]
+
+        with tempfile.TemporaryDirectory() as directory:
+            workbooks = []
+            for report_class in (_OpenpyxlReport, _XmlReport):
+                report = report_class()
+                for detail in details:
+                    report.write_detail(detail)
+                path = os.path.join(directory, f'{report_class.__name__}.xlsx')
+                report.save(summary_data, path)
+                workbooks.append(load_workbook(path))
+
+        expected, actual = workbooks
+        self.assertEqual(actual.sheetnames, expected.sheetnames)
+        for name in expected.sheetnames:
+            expected_cells = [[(cell.value, cell.number_format) for cell in row]
+                              for row in expected[name].iter_rows()]
+            actual_cells = [[(cell.value, cell.number_format) for cell in row]
+                            for row in actual[name].iter_rows()]
+            self.assertEqual(actual_cells, expected_cells, name)
+        self.assertEqual(actual['Test Results']['G2'].value, timestamp)
+
+
+if __name__ == '__main__':
+    unittest.main()
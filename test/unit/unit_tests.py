@@ -10,12 +10,18 @@ EXPORT:
 
 An example is given to make the export run cleanly.
 """
+import copy
 import unittest
 
-from utils.pieces import Pawn, Knight, Bishop, Rook, Queen, King, Piece
+from utils.pieces import Pawn, Knight, Bishop, Rook, Queen, King, Piece, RAYS, WHITE, BLACK
 from utils.board import Board
+from utils.game import Game
 from utils.check_detector import CheckDetector
+from utils.move_validator import MoveValidator
 from utils.static_chess_methods import StaticChessMethods
+from utils import bitboards
+from utils import movegen_numba
+from utils import zobrist
 
 
 def test_case(test_id, description):
@@ -512,6 +518,647 @@ class TestChessGameUnit(unittest.TestCase):
         self.assertEqual(original.row, 1)
         self.assertEqual(original.col, 4)
 
+    @test_case('TC-UNIT-019', 'Verify bitboard attack tables and sliding attacks')
+    def test_bitboard_attacks(self):
+        """
+        Test the precomputed bitboard tables:
+        - Knight and king attack counts from the center and corner
+        - Sliding attacks stop at (and include) the first blocker
+        - Set-wise knight shifts never wrap around the board edge
+        """
+        e4 = bitboards.square_index(3, 4)
+        a1 = bitboards.square_index(0, 0)
+
+        self.assertEqual(bin(bitboards.KNIGHT_ATTACKS[e4]).count('1'), 8)
+        self.assertEqual(bin(bitboards.KNIGHT_ATTACKS[a1]).count('1'), 2)
+        self.assertEqual(bin(bitboards.KING_ATTACKS[a1]).count('1'), 3)
+
+        # Rook on D4 with an empty board has 14 moves, bishop has 13
+        d4 = bitboards.square_index(3, 3)
+        self.assertEqual(bin(bitboards.rook_attacks(d4, 0)).count('1'), 14)
+        self.assertEqual(bin(bitboards.bishop_attacks(d4, 0)).count('1'), 13)
+
+        # Blocker on D6 cuts off D7 and D8 but D6 itself stays attacked
+        d6 = bitboards.square_index(5, 3)
+        attacks = bitboards.rook_attacks(d4, 1 << d6)
+        self.assertTrue(attacks >> d6 & 1)
+        self.assertFalse(attacks >> bitboards.square_index(6, 3) & 1)
+        self.assertEqual(bin(attacks).count('1'), 12)
+
+        # Set-wise knight shifts from every square match the attack table
+        for square in range(64):
+            targets = 0
+            for offset, source_mask in bitboards.KNIGHT_SHIFTS:
+                targets |= bitboards.shift((1 << square) & source_mask, offset)
+            self.assertEqual(targets, bitboards.KNIGHT_ATTACKS[square])
+
+    @test_case('TC-UNIT-020', 'Verify Board.get_legal_moves() matches the piece move generators')
+    def test_board_bitboard_move_generation(self):
+        """
+        Test Board.get_legal_moves() against Piece.get_legal_moves():
+        - 20 moves for each side from the starting position
+        - Same set of moves as the per-piece generators
+        - Moves are packed integers and promotions are flagged
+        """
+        board = Board()
+
+        for color in ('white', 'black'):
+            expected = set()
+            for row in range(8):
+                for col in range(8):
+                    piece = board.grid[row][col]
+                    if piece is None or piece.color != color:
+                        continue
+                    for move in piece.get_legal_moves():
+                        dest_row, dest_col = StaticChessMethods.uci_to_indices(move)
+                        expected.add(bitboards.encode_move(row * 8 + col, dest_row * 8 + dest_col))
+
+            legal_moves = board.get_legal_moves(color)
+            self.assertEqual(len(legal_moves), 20)
+            self.assertEqual(set(legal_moves), expected)
+
+        # Moves round trip through the packed integer format
+        move = bitboards.encode_move(52, 60, bitboards.QUEEN)
+        self.assertEqual(bitboards.decode_move(move), (52, 60, bitboards.QUEEN))
+
+        # Pawns reaching the last rank are flagged as queen promotions
+        grid = [[None for _ in range(8)] for _ in range(8)]
+        grid[6][0] = Pawn('white', 6, 0, grid)
+        board.set_grid(grid)
+        self.assertEqual(board.get_legal_moves('white'),
+                         [bitboards.encode_move(48, 56, bitboards.QUEEN)])
+
+    @unittest.skipUnless(movegen_numba.NUMBA_AVAILABLE, 'numba is not installed')
+    @test_case('TC-UNIT-021', 'Verify compiled move generator matches the bitboard generator')
+    def test_numba_move_generation(self):
+        """
+        Test movegen_numba.gen_moves() against the pure Python bitboard generator:
+        - Same moves from the starting position
+        - Same moves with sliding pieces, captures, and blocked pawns
+        - Same square codes from a grid and check status as attackers_to()
+        """
+        board = Board()
+        grid = [[None for _ in range(8)] for _ in range(8)]
+        grid[3][3] = Queen('white', 3, 3, grid)
+        grid[5][3] = Pawn('black', 5, 3, grid)
+        grid[4][4] = Knight('black', 4, 4, grid)
+        grid[1][4] = Pawn('white', 1, 4, grid)
+        grid[2][4] = Bishop('black', 2, 4, grid)
+        grid[0][4] = King('white', 0, 4, grid)
+        grid[7][0] = Rook('black', 7, 0, grid)
+
+        for test_grid in (board.grid, grid):
+            board.set_grid(test_grid)
+            self.assertEqual(movegen_numba.grid_to_codes(test_grid).tolist(), board.codes.tolist())
+            for side, color in enumerate(('white', 'black')):
+                compiled = movegen_numba.legal_moves(board.codes, side)
+                self.assertEqual(sorted(compiled), sorted(board._get_bitboard_moves(side)))
+                king_square = board.king_squares[side]
+                if king_square is not None:
+                    attacked = bitboards.attackers_to(king_square, 1 - side, board.bb, board.occ) != 0
+                    self.assertEqual(bool(movegen_numba.in_check(board.codes, side)), attacked)
+
+    @test_case('TC-UNIT-022', 'Verify Board.set_piece() places the requested piece')
+    def test_board_set_piece(self):
+        """
+        Test Board.set_piece() method:
+        - Creates the right piece class for the piece type
+        - Replaces whatever was on the square
+        - Keeps the bitboards and piece lists in sync with the grid
+        """
+        board = Board()
+
+        piece = board.set_piece('E2', 'queen', 'black')
+        self.assertIsInstance(piece, Queen)
+        self.assertIs(board.get_piece('E2'), piece)
+        self.assertEqual((piece.row, piece.col), (1, 4))
+        self.assertEqual(piece.color, 'black')
+
+        e2 = bitboards.square_index(1, 4)
+        self.assertTrue(board.bb[bitboards.bitboard_index('black', 'queen')] >> e2 & 1)
+        self.assertFalse(board.bb[bitboards.bitboard_index('white', 'pawn')] >> e2 & 1)
+
+        # Piece lists follow the grid
+        self.assertIn(piece, board.pieces[1])
+        self.assertEqual(len(board.pieces[0]), 15)
+        self.assertEqual(len(board.pieces[1]), 17)
+
+    @test_case('TC-UNIT-023', 'Verify get_legal_moves() appends into a shared output list')
+    def test_piece_moves_output_list(self):
+        """
+        Test the optional output list of Piece.get_legal_moves():
+        - Moves are appended after whatever is already in the list
+        - The same list object is returned
+        """
+        board = Board()
+        knight = board.get_piece('B1')
+        rook = board.get_piece('A1')
+
+        out = ['X1']
+        result = knight.get_legal_moves(out)
+        self.assertIs(result, out)
+        self.assertEqual(out, ['X1'] + knight.get_legal_moves())
+
+        # A blocked rook adds nothing
+        rook.get_legal_moves(out)
+        self.assertEqual(len(out), 3)
+
+    @test_case('TC-UNIT-024', 'Verify Zobrist hashes identify positions')
+    def test_zobrist_hash(self):
+        """
+        Test the Zobrist hash kept by the board:
+        - Equal positions hash the same
+        - Changing a piece changes the hash
+        - Toggling piece keys matches a full recompute
+        """
+        board = Board()
+        other = Board()
+        self.assertEqual(board.hash, other.hash)
+        self.assertNotEqual(board.hash, zobrist.hash_bitboards(board.bb, black_to_move=True))
+
+        start_hash = board.hash
+        board.set_piece('E2', 'queen', 'white')
+        self.assertNotEqual(board.hash, start_hash)
+
+        # Replace the white pawn on E2 with a white queen one key at a time
+        e2 = bitboards.square_index(1, 4)
+        incremental = zobrist.toggle_piece(start_hash, bitboards.bitboard_index('white', 'pawn'), e2)
+        incremental = zobrist.toggle_piece(incremental, bitboards.bitboard_index('white', 'queen'), e2)
+        self.assertEqual(incremental, board.hash)
+
+    @test_case('TC-UNIT-025', 'Verify move_piece_copy() clones the grid without disturbing the board')
+    def test_move_piece_shallow_clone(self):
+        """
+        Test Board.move_piece_copy() and the grid argument of get_legal_moves():
+        - The current grid and the moved piece are left untouched
+        - Unmoved pieces generate moves on whichever grid is passed in
+        """
+        board = Board()
+        pawn = board.get_piece('E2')
+        new_grid, captured = board.move_piece_copy('E2', 'E4')
+
+        self.assertIsNone(captured)
+        self.assertIs(board.grid[1][4], pawn)
+        self.assertEqual((pawn.row, pawn.col), (1, 4))
+        self.assertIsNone(new_grid[1][4])
+        self.assertEqual((new_grid[3][4].row, new_grid[3][4].col), (3, 4))
+
+        # The king only gains E2 once the pawn has left it
+        king = board.get_piece('E1')
+        self.assertEqual(king.get_legal_moves(), [])
+        self.assertEqual(king.get_legal_moves(grid=new_grid), ['E2'])
+
+    @test_case('TC-UNIT-026', 'Verify bitboards.attackers_to() finds every attacking piece')
+    def test_attackers_to(self):
+        """
+        Test bitboards.attackers_to():
+        - Finds pawn, knight, and sliding attackers of a square
+        - Ignores blocked sliders and pieces of the other color
+        """
+        grid = [[None] * 8 for _ in range(8)]
+        grid[4][4] = King('black', 4, 4, grid)    # E5
+        grid[3][3] = Pawn('white', 3, 3, grid)    # D4 pawn attacks E5
+        grid[2][5] = Knight('white', 2, 5, grid)  # F3 knight attacks E5
+        grid[0][4] = Rook('white', 0, 4, grid)    # E1 rook blocked by E2
+        grid[1][4] = Pawn('black', 1, 4, grid)
+        grid[7][1] = Bishop('white', 7, 1, grid)  # B8 bishop attacks E5
+
+        bb = bitboards.grid_to_bitboards(grid)
+        occupied = 0
+        for bitboard in bb:
+            occupied |= bitboard
+
+        e5 = bitboards.square_index(4, 4)
+        attackers = bitboards.attackers_to(e5, 0, bb, occupied)
+        expected = {bitboards.square_index(3, 3), bitboards.square_index(2, 5),
+                    bitboards.square_index(7, 1)}
+        self.assertEqual(set(bitboards.iter_squares(attackers)), expected)
+        self.assertTrue(CheckDetector.is_in_check('black', grid))
+        self.assertEqual(bitboards.attackers_to(e5, 1, bb, occupied), 0)
+
+    @test_case('TC-UNIT-027', 'Verify MoveValidator reuses results until the board changes')
+    def test_move_validator_cache(self):
+        """
+        Test MoveValidator.generate_valid_moves() caching:
+        - Repeated calls on the same position return the cached moves
+        - Changing the board or the player regenerates the moves
+        - Returning to an earlier position reuses its cached moves
+        """
+        board = Board()
+        validator = MoveValidator(board)
+
+        first = validator.generate_valid_moves('white')
+        self.assertEqual(validator.generate_valid_moves('white'), first)
+        self.assertEqual(len(first[0]), 20)
+
+        # Same position, other player
+        black_first = validator.generate_valid_moves('black')
+        self.assertNotEqual(black_first, first)
+
+        # Move a pawn by swapping in a new grid
+        start_grid = board.grid
+        new_grid, _ = board.move_piece_copy('E2', 'E4')
+        board.set_grid(new_grid)
+        legal_moves, _ = validator.generate_valid_moves('white')
+        self.assertIn('E4 E5', legal_moves)
+        self.assertIn('E1 E2', legal_moves)
+
+        # Back to the starting position, both players hit the cache
+        board.set_grid(start_grid)
+        self.assertEqual(validator.generate_valid_moves('white'), first)
+        self.assertEqual(validator.generate_valid_moves('black'), black_first)
+
+    @test_case('TC-UNIT-028', 'Verify self-check detection on bitboards without moving pieces')
+    def test_move_leaves_king_in_check(self):
+        """
+        Test CheckDetector.move_leaves_king_in_check() and Board.king_squares:
+        - King squares are tracked for both colors
+        - Moving a pinned piece or walking into an attack is caught
+        - Capturing the attacker is allowed
+        """
+        board = Board()
+        self.assertEqual(board.king_squares, (4, 60))
+
+        grid = [[None] * 8 for _ in range(8)]
+        grid[0][4] = King('white', 0, 4, grid)    # E1
+        grid[1][4] = Rook('white', 1, 4, grid)    # E2, pinned
+        grid[7][4] = Rook('black', 7, 4, grid)    # E8
+        grid[6][3] = Rook('black', 6, 3, grid)    # D7 covers the D file
+        board.set_grid(grid)
+
+        e1, e2, e8 = 4, 12, 60
+        self.assertEqual(board.king_squares, (e1, None))
+        self.assertTrue(CheckDetector.move_leaves_king_in_check(board, 'white', e2, 11))
+        self.assertFalse(CheckDetector.move_leaves_king_in_check(board, 'white', e2, e8))
+        self.assertTrue(CheckDetector.move_leaves_king_in_check(board, 'white', e1, 3))
+        self.assertFalse(CheckDetector.move_leaves_king_in_check(board, 'white', e1, 5))
+
+    @test_case('TC-UNIT-029', 'Verify Board.copy() creates an independent board')
+    def test_board_copy(self):
+        """
+        Test Board.copy() method:
+        - The copy has the same pieces, bitboards, and hash
+        - Changing the copy leaves the original untouched
+        - copy.copy() and copy.deepcopy() go through Board.copy()
+        """
+        board = Board()
+        board_copy = board.copy()
+
+        self.assertEqual(board_copy.display(), board.display())
+        self.assertEqual(board_copy.bb, board.bb)
+        self.assertEqual(board_copy.hash, board.hash)
+        self.assertIsNot(board_copy.get_piece('E2'), board.get_piece('E2'))
+        self.assertIs(board_copy.get_piece('E2').grid, board_copy.grid)
+
+        board_copy.set_piece('E2', 'queen', 'black')
+        self.assertEqual(board.get_piece('E2').piece_type, 'pawn')
+        self.assertNotEqual(board_copy.hash, board.hash)
+
+        for copied in (copy.copy(board), copy.deepcopy(board)):
+            self.assertEqual(copied.display(), board.display())
+            self.assertEqual(copied.hash, board.hash)
+            self.assertIsNot(copied.get_piece('E2'), board.get_piece('E2'))
+            self.assertIs(copied.get_piece('E2').grid, copied.grid)
+
+    @test_case('TC-UNIT-030', 'Verify Board.apply_moves() matches playing moves one at a time')
+    def test_board_apply_moves(self):
+        """
+        Test Board.apply_moves() method:
+        - Ends in the same position as move_piece_copy() + set_grid() per move
+        - Reports captured pieces and promotes pawns
+        """
+        moves = [('E2', 'E4'), ('D7', 'D5'), ('E4', 'D5'), ('D8', 'D5')]
+        expected = Board()
+        for source, destination in moves:
+            new_grid, _ = expected.move_piece_copy(source, destination)
+            expected.set_grid(new_grid)
+
+        board = Board()
+        captured = board.apply_moves(moves)
+        self.assertEqual(board.display(), expected.display())
+        self.assertEqual(board.hash, expected.hash)
+        self.assertEqual([str(piece) for piece in captured], ['None', 'None', 'p', 'P'])
+
+        # Promotion on the last rank
+        grid = [[None] * 8 for _ in range(8)]
+        grid[6][0] = Pawn('white', 6, 0, grid)
+        board.set_grid(grid)
+        board.apply_moves([('A7', 'A8')])
+        self.assertEqual(board.get_piece('A8').piece_type, 'queen')
+
+    @test_case('TC-UNIT-031', 'Verify integer piece type and color indices match the strings')
+    def test_piece_type_and_color_indices(self):
+        """
+        Test the Color and PieceType enums:
+        - Every piece's type_index and color_index match its strings
+        - The enums line up with the bitboard ordering
+        - Colors are stored as the interned WHITE and BLACK names
+        """
+        board = Board()
+        for row in (0, 1, 6, 7):
+            for piece in board.grid[row]:
+                self.assertEqual(piece.type_index, bitboards.PieceType[piece.piece_type.upper()])
+                self.assertEqual(piece.color_index, bitboards.Color[piece.color.upper()])
+                self.assertEqual(
+                    piece.color_index * 6 + piece.type_index,
+                    bitboards.bitboard_index(piece.color, piece.piece_type),
+                )
+
+        # A color string built at runtime is replaced by the interned name
+        runtime_color = ''.join(['bl', 'ack'])
+        self.assertIs(Pawn(runtime_color, 6, 0, self.empty_grid).color, BLACK)
+        self.assertIs(board.get_piece('E1').color, WHITE)
+
+    @test_case('TC-UNIT-032', 'Verify Board.is_in_check() matches CheckDetector')
+    def test_board_is_in_check(self):
+        """
+        Test Board.is_in_check:
+        - Each piece type giving check is detected
+        - Blocked sliders are not check
+        - Answers match CheckDetector.is_in_check and CheckDetector.both_in_check
+        """
+        attackers = [
+            (Pawn, 'black', 4, 5, True),
+            (Knight, 'black', 5, 5, True),
+            (Bishop, 'black', 6, 7, True),
+            (Rook, 'black', 3, 0, False),  # Blocked by the white pawn on B4
+            (Queen, 'black', 7, 4, True),
+            (King, 'black', 4, 3, True),
+        ]
+        board = Board()
+        for piece_class, color, row, col, expected in attackers:
+            grid = [[None] * 8 for _ in range(8)]
+            grid[3][4] = King('white', 3, 4, grid)
+            grid[3][1] = Pawn('white', 3, 1, grid)
+            grid[row][col] = piece_class(color, row, col, grid)
+            board.set_grid(grid)
+            self.assertEqual(board.is_in_check('white'), expected, piece_class.__name__)
+            self.assertEqual(board.is_in_check('white'), CheckDetector.is_in_check('white', grid))
+            self.assertEqual(board.is_in_check('black'), CheckDetector.is_in_check('black', grid))
+            self.assertEqual(CheckDetector.both_in_check(grid),
+                             (board.is_in_check('white'), board.is_in_check('black')))
+
+    @test_case('TC-UNIT-033', 'Verify Board.move_piece() matches move_piece_copy() and set_grid()')
+    def test_board_move_piece(self):
+        """
+        Test Board.move_piece() method:
+        - Returns the captured piece
+        - Leaves the grid, bitboards, king squares and hash in the same state as move_piece_copy() + set_grid()
+        - Promotes pawns reaching the last rank
+        """
+        moves = [('E2', 'E4'), ('D7', 'D5'), ('E4', 'D5'), ('D8', 'D5'), ('E1', 'E2')]
+        expected = Board()
+        board = Board()
+        for source, destination in moves:
+            new_grid, expected_capture = expected.move_piece_copy(source, destination)
+            expected.set_grid(new_grid)
+            captured = board.move_piece(source, destination)
+            self.assertIs(type(captured), type(expected_capture))
+            self.assertEqual(board.display(), expected.display())
+            self.assertEqual(board.bb, expected.bb)
+            self.assertEqual(board.occ, expected.occ)
+            self.assertEqual(board.king_squares, expected.king_squares)
+            self.assertEqual(board.hash, expected.hash)
+        self.assertEqual(len(board.pieces[0]), 15)
+        self.assertEqual(len(board.pieces[1]), 15)
+
+        # Promotion on the last rank replaces the pawn in the piece list too
+        grid = [[None] * 8 for _ in range(8)]
+        grid[6][0] = Pawn('white', 6, 0, grid)
+        board.set_grid(grid)
+        board.move_piece('A7', 'A8')
+        self.assertEqual(board.get_piece('A8').piece_type, 'queen')
+        self.assertEqual(board.pieces[0], [board.get_piece('A8')])
+
+    @test_case('TC-UNIT-034', 'Verify the generated ray walkers stop at the board edge and blockers')
+    def test_generated_rays(self):
+        """
+        Test the per-direction ray functions in pieces.RAYS:
+        - On an empty board each ray from D4 reaches the board edge
+        - A ray stops at the first piece and includes it only if it is an enemy
+        """
+        grid = [[None] * 8 for _ in range(8)]
+        to_uci = StaticChessMethods.indices_to_uci
+        # Squares from D4 (row 3, col 3) to the edge in each direction
+        expected_lengths = {
+            (1, 0): 4, (-1, 0): 3, (0, 1): 4, (0, -1): 3,
+            (1, 1): 4, (1, -1): 3, (-1, 1): 3, (-1, -1): 3,
+        }
+        for direction, ray in RAYS.items():
+            moves = []
+            ray(3, 3, 0, grid, moves, to_uci)
+            self.assertEqual(len(moves), expected_lengths[direction], direction)
+
+        # Friendly piece on D6 blocks, enemy piece on F6 is captured
+        grid[5][3] = Pawn('white', 5, 3, grid)
+        grid[5][5] = Pawn('black', 5, 5, grid)
+        moves = []
+        RAYS[(1, 0)](3, 3, 0, grid, moves, to_uci)
+        self.assertEqual(moves, ['D5'])
+        moves = []
+        RAYS[(1, 1)](3, 3, 0, grid, moves, to_uci)
+        self.assertEqual(moves, ['E5', 'F6'])
+
+    @test_case('TC-UNIT-035', 'Verify the flat square codes mirror the grid')
+    def test_board_piece_bytes(self):
+        """
+        Test Board.piece_byte() method:
+        - Codes are piece index + 1, negative for black, 0 for empty squares
+        - Codes follow pieces moved with move_piece() and are copied by copy()
+        """
+        board = Board()
+        self.assertEqual(board.piece_byte(bitboards.square_index(0, 4)), bitboards.KING + 1)
+        self.assertEqual(board.piece_byte(bitboards.square_index(6, 0)), -(bitboards.PAWN + 1))
+        self.assertEqual(board.piece_byte(bitboards.square_index(3, 3)), 0)
+
+        board_copy = board.copy()
+        board.move_piece('G1', 'F3')
+        self.assertEqual(board.piece_byte(bitboards.square_index(0, 6)), 0)
+        self.assertEqual(board.piece_byte(bitboards.square_index(2, 5)), bitboards.KNIGHT + 1)
+        # The copy keeps its own codes
+        self.assertEqual(board_copy.piece_byte(bitboards.square_index(0, 6)), bitboards.KNIGHT + 1)
+
+    @test_case('TC-UNIT-036', 'Verify Board.reset_to_startpos() restores the starting position')
+    def test_board_reset_to_startpos(self):
+        """
+        Test Board.reset_to_startpos() method:
+        - Undoes moves and placed pieces
+        - New boards don't share pieces with each other
+        """
+        expected = Board()
+        board = Board()
+        board.apply_moves([('E2', 'E4'), ('D7', 'D5'), ('E4', 'D5')])
+        board.set_piece('A4', 'queen', 'black')
+        board.reset_to_startpos()
+        self.assertEqual(board.display(), expected.display())
+        self.assertEqual(board.bb, expected.bb)
+        self.assertEqual(board.hash, expected.hash)
+        self.assertEqual(len(board.pieces[0]), 16)
+        self.assertEqual(len(board.pieces[1]), 16)
+
+        # Moving a piece on one board leaves the other untouched
+        board.move_piece('E2', 'E4')
+        self.assertIsNot(board.grid[3][4], expected.grid[1][4])
+        self.assertEqual(expected.get_piece('E2').row, 1)
+
+    @test_case('TC-UNIT-037', 'Verify Board.popcount() and Board.clear_all()')
+    def test_board_popcount_clear_all(self):
+        """
+        Test Board.popcount() and Board.clear_all() methods:
+        - popcount counts each color's pieces
+        - Captures lower the count
+        - clear_all empties the grid in place and resets the bitboards
+        """
+        board = Board()
+        self.assertEqual(board.popcount('white'), 16)
+        self.assertEqual(board.popcount('black'), 16)
+
+        board.apply_moves([('E2', 'E4'), ('D7', 'D5'), ('E4', 'D5')])
+        self.assertEqual(board.popcount('white'), 16)
+        self.assertEqual(board.popcount('black'), 15)
+
+        grid = board.grid
+        board.clear_all()
+        self.assertIs(board.grid, grid)
+        self.assertTrue(all(piece is None for row in grid for piece in row))
+        self.assertEqual(board.bb, [0] * 12)
+        self.assertEqual(board.occ, 0)
+        self.assertEqual(board.hash, 0)
+        self.assertEqual(board.king_squares, (None, None))
+        self.assertEqual(board.popcount('white'), 0)
+        self.assertEqual(board.popcount('black'), 0)
+
+    @test_case('TC-UNIT-038', 'Verify copying a Game gives an independent game')
+    def test_game_copy(self):
+        """
+        Test Game.copy() method and copy.deepcopy of a Game:
+        - The copy has its own board and a validator bound to that board
+        - Player and game over state carry over
+        - Moves on the copy leave the original untouched
+        """
+        game = Game()
+        game.current_player = 'black'
+        game_copy = copy.deepcopy(game)
+        self.assertIsNot(game_copy.board, game.board)
+        self.assertIs(game_copy.move_validator.board, game_copy.board)
+        self.assertEqual(game_copy.current_player, 'black')
+        self.assertFalse(game_copy.game_over)
+
+        game_copy.board.move_piece('E7', 'E5')
+        self.assertIsNotNone(game.board.get_piece('E7'))
+        self.assertIsNone(game_copy.board.get_piece('E7'))
+
+    @test_case('TC-UNIT-039', 'Verify Board.from_fen() and Board.load_fen() build the given position')
+    def test_board_from_fen(self):
+        """
+        Test Board.from_fen() and Board.load_fen() methods:
+        - The starting position FEN matches a new board
+        - Boards loaded from the same FEN don't share pieces
+        - Invalid FEN raises ValueError
+        """
+        start_fen = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1'
+        expected = Board()
+        board = Board.from_fen(start_fen)
+        self.assertEqual(board.display(), expected.display())
+        self.assertEqual(board.bb, expected.bb)
+        self.assertEqual(board.hash, expected.hash)
+
+        board = Board.from_fen('4k3/3QQ3/8/8/8/8/8/4K3')
+        self.assertEqual(board.king_squares, (4, 60))
+        self.assertEqual(board.get_piece('D7').piece_type, 'queen')
+        self.assertEqual(board.get_piece('E8').color, 'black')
+        self.assertEqual(board.popcount('white'), 3)
+
+        other = Board()
+        other.load_fen('4k3/3QQ3/8/8/8/8/8/4K3 b - -')
+        self.assertEqual(other.bb, board.bb)
+        board.move_piece('D7', 'D1')
+        self.assertEqual(other.get_piece('D7').row, 6)
+
+        for fen in ('', '8/8/8', '9/8/8/8/8/8/8/8', '4x3/8/8/8/8/8/8/8', '7/8/8/8/8/8/8/8'):
+            with self.assertRaises(ValueError):
+                Board.from_fen(fen)
+
+    @unittest.skipUnless(movegen_numba.NUMBA_AVAILABLE, 'numba is not installed')
+    @test_case('TC-UNIT-040', 'Verify the compiled self-check filter matches the bitboard check')
+    def test_numba_safe_moves(self):
+        """
+        Test movegen_numba.split_safe_moves():
+        - Safe and unsafe moves together are every generated move
+        - Each move lands on the side move_leaves_king_in_check() puts it on
+        - The board's square codes are left untouched
+        """
+        grid = [[None for _ in range(8)] for _ in range(8)]
+        grid[0][4] = King('white', 0, 4, grid)    # E1
+        grid[1][4] = Rook('white', 1, 4, grid)    # E2, pinned
+        grid[7][4] = Rook('black', 7, 4, grid)    # E8
+        grid[6][3] = Rook('black', 6, 3, grid)    # D7 covers the D file
+        grid[3][1] = Knight('white', 3, 1, grid)  # B4
+        board = Board()
+        board.set_grid(grid)
+        codes_before = board.codes.tolist()
+
+        safe_moves, unsafe_moves = movegen_numba.split_safe_moves(board.codes, 0)
+        self.assertEqual(sorted(safe_moves + unsafe_moves),
+                         sorted(movegen_numba.legal_moves(board.codes, 0)))
+        self.assertTrue(unsafe_moves)
+        for moves, leaves_check in ((safe_moves, False), (unsafe_moves, True)):
+            for move in moves:
+                from_square, to_square, _ = bitboards.decode_move(move)
+                self.assertEqual(CheckDetector.move_leaves_king_in_check(
+                    board, 'white', from_square, to_square), leaves_check)
+        self.assertEqual(board.codes.tolist(), codes_before)
+
+    @test_case('TC-UNIT-041', 'Verify changing a returned move list leaves the move cache intact')
+    def test_move_validator_cache_copies(self):
+        """
+        Test that MoveValidator.generate_valid_moves() hands out copies:
+        - Changing the returned lists doesn't change the next result
+        - Cache hits return new lists each call
+        """
+        validator = MoveValidator(Board())
+
+        legal_moves, king_in_check_moves = validator.generate_valid_moves('white')
+        expected = list(legal_moves)
+        legal_moves.clear()
+        king_in_check_moves.append('E1 E8')
+
+        legal_moves, king_in_check_moves = validator.generate_valid_moves('white')
+        self.assertEqual(legal_moves, expected)
+        self.assertNotIn('E1 E8', king_in_check_moves)
+
+        legal_moves.append('A1 A8')
+        again, _ = validator.generate_valid_moves('white')
+        self.assertIsNot(again, legal_moves)
+        self.assertEqual(again, expected)
+
+    @test_case('TC-UNIT-042', 'Verify the validator sees direct grid edits after update_bitboards()')
+    def test_move_validator_direct_grid_edit(self):
+        """
+        Test MoveValidator after writing board.grid directly:
+        - update_bitboards() brings the bitboards and hash in line with the grid
+        - Moves are then validated against the edited position
+        - The cached moves of the old position aren't reused
+        """
+        board = Board()
+        validator = MoveValidator(board)
+        self.assertEqual(validator.is_valid_move('D1', 'H5', 'white'),
+                         (False, "That path is blocked"))
+        start_hash = board.hash
+
+        # Move the E2 pawn to E3 by hand
+        pawn = board.grid[1][4]
+        board.grid[2][4] = pawn
+        board.grid[1][4] = None
+        pawn.set_row_col(2, 4)
+        board.update_bitboards()
+
+        self.assertNotEqual(board.hash, start_hash)
+        self.assertEqual(validator.is_valid_move('E3', 'E4', 'white'), (True, ""))
+        self.assertEqual(validator.is_valid_move('D1', 'H5', 'white'), (True, ""))
+        legal_moves, _ = validator.generate_valid_moves('white')
+        self.assertNotIn('E2 E4', legal_moves)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
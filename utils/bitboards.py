@@ -0,0 +1,328 @@
+"""
+Bitboard tables and helpers.
+
+A bitboard is a 64-bit integer where bit (row * 8 + col) is set when the
+matching square is occupied. Square 0 is A1 and square 63 is H8, which lines
+up with the (row, col) indices used by the board grid.
+
+Attack sets for every piece are precomputed once at import so move
+generation only needs a handful of AND/OR/shift operations per piece.
+"""
+from enum import IntEnum
+
+# Every square on the board
+FULL_BOARD = (1 << 64) - 1
+
+# Order used to index the 12 piece bitboards: color * 6 + piece index
+COLORS = ('white', 'black')
+PIECE_TYPES = ('pawn', 'knight', 'bishop', 'rook', 'queen', 'king')
+PIECE_INDEX = {piece_type: index for index, piece_type in enumerate(PIECE_TYPES)}
+
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+
+
+class Color(IntEnum):
+    """Color indices, matching Piece.color_index."""
+    WHITE = 0
+    BLACK = 1
+
+
+class PieceType(IntEnum):
+    """Piece type indices, matching Piece.type_index and the bitboard order."""
+    PAWN = PAWN
+    KNIGHT = KNIGHT
+    BISHOP = BISHOP
+    ROOK = ROOK
+    QUEEN = QUEEN
+    KING = KING
+
+
+# File and rank masks, used to stop set-wise shifts wrapping around the board edge
+FILE_A = 0x0101010101010101
+FILE_B = FILE_A << 1
+FILE_G = FILE_A << 6
+FILE_H = FILE_A << 7
+NOT_FILE_A = FULL_BOARD ^ FILE_A
+NOT_FILE_H = FULL_BOARD ^ FILE_H
+NOT_FILE_AB = FULL_BOARD ^ (FILE_A | FILE_B)
+NOT_FILE_GH = FULL_BOARD ^ (FILE_G | FILE_H)
+RANK_1 = 0xFF
+RANK_3 = RANK_1 << 16
+RANK_6 = RANK_1 << 40
+RANK_8 = RANK_1 << 56
+
+# Knight jumps as (square offset, mask of source squares the jump stays on the board from)
+KNIGHT_SHIFTS = (
+    (17, NOT_FILE_H), (15, NOT_FILE_A), (10, NOT_FILE_GH), (6, NOT_FILE_AB),
+    (-6, NOT_FILE_GH), (-10, NOT_FILE_AB), (-15, NOT_FILE_H), (-17, NOT_FILE_A),
+)
+
+
+def square_index(row, col):
+    """
+    Convert grid indices to a bitboard square index.
+
+    Args:
+        row (int): Row index (0-7)
+        col (int): Column index (0-7)
+
+    Returns:
+        int: Square index (0-63)
+    """
+    return row * 8 + col
+
+
+def bitboard_index(color, piece_type):
+    """
+    Get the position of a piece's bitboard in the 12 entry bitboard list.
+
+    Args:
+        color (str): 'white' or 'black'
+        piece_type (str): 'pawn', 'knight', 'bishop', 'rook', 'queen' or 'king'
+
+    Returns:
+        int: Index (0-11)
+    """
+    return COLORS.index(color) * 6 + PIECE_INDEX[piece_type]
+
+
+def encode_move(from_square, to_square, promotion=0):
+    """
+    Pack a move into a single integer.
+
+    Bits 0-5 hold the source square, bits 6-11 the destination square
+    and bits 12-15 the piece index promoted to (0 for no promotion).
+
+    Args:
+        from_square (int): Source square index (0-63)
+        to_square (int): Destination square index (0-63)
+        promotion (int): KNIGHT, BISHOP, ROOK or QUEEN, 0 for no promotion
+
+    Returns:
+        int: Encoded move
+    """
+    return from_square | to_square << 6 | promotion << 12
+
+
+def decode_move(move):
+    """
+    Unpack a move built by encode_move.
+
+    Args:
+        move (int): Encoded move
+
+    Returns:
+        tuple: (from_square, to_square, promotion)
+    """
+    return move & 63, move >> 6 & 63, move >> 12
+
+
+def shift(bitboard, offset):
+    """
+    Move every set bit of a bitboard by the same number of squares.
+
+    Bits pushed past H8 or A1 are dropped. Callers mask out the source files
+    that would wrap around the side of the board before shifting.
+
+    Args:
+        bitboard (int): The bitboard to shift
+        offset (int): Squares to move by, positive towards H8
+
+    Returns:
+        int: Shifted bitboard
+    """
+    if offset >= 0:
+        return (bitboard << offset) & FULL_BOARD
+    return bitboard >> -offset
+
+
+def iter_squares(bitboard):
+    """
+    Yield the square index of every set bit, lowest square first.
+
+    Args:
+        bitboard (int): The bitboard to walk
+
+    Yields:
+        int: Square index (0-63)
+    """
+    while bitboard:
+        # Isolate the lowest set bit and clear it
+        lowest = bitboard & -bitboard
+        yield lowest.bit_length() - 1
+        bitboard ^= lowest
+
+
+def _build_leaper_table(offsets):
+    """Build a per-square attack table for pieces that jump by fixed offsets."""
+    table = []
+    for square in range(64):
+        row, col = divmod(square, 8)
+        attacks = 0
+        for row_offset, col_offset in offsets:
+            cur_row = row + row_offset
+            cur_col = col + col_offset
+            if 0 <= cur_row <= 7 and 0 <= cur_col <= 7:
+                attacks |= 1 << square_index(cur_row, cur_col)
+        table.append(attacks)
+    return tuple(table)
+
+
+def _build_ray_table(row_direction, col_direction):
+    """Build a per-square table of every square along one direction."""
+    table = []
+    for square in range(64):
+        row, col = divmod(square, 8)
+        ray = 0
+        cur_row, cur_col = row + row_direction, col + col_direction
+        while 0 <= cur_row <= 7 and 0 <= cur_col <= 7:
+            ray |= 1 << square_index(cur_row, cur_col)
+            cur_row += row_direction
+            cur_col += col_direction
+        table.append(ray)
+    return tuple(table)
+
+
+KNIGHT_ATTACKS = _build_leaper_table(
+    ((-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1))
+)
+KING_ATTACKS = _build_leaper_table(
+    ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+)
+
+# Squares a pawn captures on, indexed by [color][square]
+# White pawns move up (increasing row), black pawns move down
+PAWN_ATTACKS = (
+    _build_leaper_table(((1, -1), (1, 1))),
+    _build_leaper_table(((-1, -1), (-1, 1))),
+)
+
+# Rays paired with whether they run towards higher square indices.
+# On a "positive" ray the nearest blocker is the lowest set bit,
+# otherwise it is the highest set bit.
+ROOK_RAYS = (
+    (_build_ray_table(1, 0), True),    # North
+    (_build_ray_table(0, 1), True),    # East
+    (_build_ray_table(-1, 0), False),  # South
+    (_build_ray_table(0, -1), False),  # West
+)
+BISHOP_RAYS = (
+    (_build_ray_table(1, 1), True),    # North east
+    (_build_ray_table(1, -1), True),   # North west
+    (_build_ray_table(-1, 1), False),  # South east
+    (_build_ray_table(-1, -1), False), # South west
+)
+
+
+def _slider_attacks(square, occupied, rays):
+    """
+    Get the squares a sliding piece attacks along the given rays.
+
+    Each ray is cut off just past its first blocker, the blocker itself
+    stays in the attack set so captures are included.
+    """
+    attacks = 0
+    for ray_table, positive in rays:
+        ray = ray_table[square]
+        blockers = ray & occupied
+        if blockers:
+            if positive:
+                blocker = (blockers & -blockers).bit_length() - 1
+            else:
+                blocker = blockers.bit_length() - 1
+            # Remove everything behind the blocker
+            ray ^= ray_table[blocker]
+        attacks |= ray
+    return attacks
+
+
+def rook_attacks(square, occupied):
+    """
+    Get the squares a rook on `square` attacks.
+
+    Args:
+        square (int): Square index of the rook (0-63)
+        occupied (int): Bitboard of every occupied square
+
+    Returns:
+        int: Attack bitboard, including the first blocker on each ray
+    """
+    return _slider_attacks(square, occupied, ROOK_RAYS)
+
+
+def bishop_attacks(square, occupied):
+    """
+    Get the squares a bishop on `square` attacks.
+
+    Args:
+        square (int): Square index of the bishop (0-63)
+        occupied (int): Bitboard of every occupied square
+
+    Returns:
+        int: Attack bitboard, including the first blocker on each ray
+    """
+    return _slider_attacks(square, occupied, BISHOP_RAYS)
+
+
+def queen_attacks(square, occupied):
+    """
+    Get the squares a queen on `square` attacks.
+
+    Args:
+        square (int): Square index of the queen (0-63)
+        occupied (int): Bitboard of every occupied square
+
+    Returns:
+        int: Attack bitboard, including the first blocker on each ray
+    """
+    return (_slider_attacks(square, occupied, ROOK_RAYS)
+            | _slider_attacks(square, occupied, BISHOP_RAYS))
+
+
+def attackers_to(square, side, bitboards, occupied):
+    """
+    Get the pieces of one side that attack a square.
+
+    Works backwards from the target: a knight on `square` would reach
+    exactly the squares enemy knights attack it from, and likewise for
+    every other piece type.
+
+    Args:
+        square (int): Square index being attacked (0-63)
+        side (int): 0 for white attackers, 1 for black attackers
+        bitboards (list): 12 bitboards indexed by color * 6 + piece index
+        occupied (int): Bitboard of every occupied square
+
+    Returns:
+        int: Bitboard of the attacking pieces
+    """
+    pieces = bitboards[side * 6:side * 6 + 6]
+    rooks_queens = pieces[ROOK] | pieces[QUEEN]
+    bishops_queens = pieces[BISHOP] | pieces[QUEEN]
+    # A pawn of the other color on `square` attacks the squares this side's pawns attack from
+    return ((PAWN_ATTACKS[1 - side][square] & pieces[PAWN])
+            | (KNIGHT_ATTACKS[square] & pieces[KNIGHT])
+            | (KING_ATTACKS[square] & pieces[KING])
+            | (bishop_attacks(square, occupied) & bishops_queens)
+            | (rook_attacks(square, occupied) & rooks_queens))
+
+
+def grid_to_bitboards(grid):
+    """
+    Build the 12 piece bitboards from an 8x8 grid of pieces.
+
+    Args:
+        grid (list): 8x8 grid of Piece objects or None
+
+    Returns:
+        list: 12 bitboards indexed by color * 6 + piece index
+    """
+    bitboards = [0] * 12
+    square = 0
+    for grid_row in grid:
+        for piece in grid_row:
+            if piece is not None:
+                index = piece.color_index * 6 + piece.type_index
+                bitboards[index] |= 1 << square
+            square += 1
+    return bitboards
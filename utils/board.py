@@ -4,8 +4,47 @@ Manages the chess board and piece positions.
 Defines the Board class which maintains the 8x8 grid
 of chess pieces, handles piece placement, movement, and board display.
 """
+import functools
+from array import array
 
-from .pieces import Piece, Pawn, Knight, Bishop, Rook, Queen, King 
+from .pieces import Piece, Pawn, Knight, Bishop, Rook, Queen, King, PIECE_CLASSES
+from . import bitboards
+from . import movegen_numba
+from . import zobrist
+from .bitboards import PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING
+from .static_chess_methods import StaticChessMethods
+
+# Piece order along the back ranks, from file A to file H
+_BACK_RANK = (Rook, Knight, Bishop, Queen, King, Bishop, Knight, Rook)
+
+# Every piece of the starting position as (piece class, color, row, col)
+# White pieces on index 0, white pawns on index 1,
+# black pawns on index 6 and black pieces on index 7
+_INITIAL_POSITION = (
+    tuple((piece_class, 'white', 0, col) for col, piece_class in enumerate(_BACK_RANK))
+    + tuple((Pawn, 'white', 1, col) for col in range(8))
+    + tuple((Pawn, 'black', 6, col) for col in range(8))
+    + tuple((piece_class, 'black', 7, col) for col, piece_class in enumerate(_BACK_RANK))
+)
+
+# Piece class for each FEN letter, uppercase letters are white pieces
+_FEN_PIECES = {'p': Pawn, 'n': Knight, 'b': Bishop, 'r': Rook, 'q': Queen, 'k': King}
+
+# Fixed lines around the board display
+_DISPLAY_SEPARATOR = "  " + "-" * 33 + "\n"
+_DISPLAY_LABELS = "    A   B   C   D   E   F   G   H\n"
+_DISPLAY_HEADER = _DISPLAY_LABELS + _DISPLAY_SEPARATOR + _DISPLAY_SEPARATOR
+_DISPLAY_ROW_END = "|\n" + _DISPLAY_SEPARATOR
+_DISPLAY_FOOTER = _DISPLAY_SEPARATOR + _DISPLAY_LABELS
+# Rank number starting each row, indexed by row
+_DISPLAY_RANKS = tuple(f"{row + 1} " for row in range(8))
+# Square of each piece, indexed like the bitboards by color * 6 + piece index
+_DISPLAY_CELLS = tuple(
+    f"| {piece_class.SYMBOLS[color_index]} "
+    for color_index in range(2)
+    for piece_class in (Pawn, Knight, Bishop, Rook, Queen, King)
+)
+_DISPLAY_EMPTY_CELL = "|   "
 
 class Board:
     """
@@ -13,17 +52,79 @@ class Board:
     
     The board is an 8x8 grid where each cell can contain a Piece or None.
     Coordinates use chess notation: files A-H (columns) and ranks 1-8 (rows).
+
+    Alongside the grid the board keeps 12 bitboards (one per piece type and
+    color), occupancy masks and a list of pieces per color, used for fast
+    move generation, plus a Zobrist hash identifying the position.
+    A flat array of 64 signed bytes (see piece_byte) mirrors the grid
+    for code that only needs each square's piece type and color.
     """
+
+    # Fully set up starting position that new boards are copied from,
+    # built by the first reset_to_startpos call
+    _startpos = None
     
     def __init__(self):
         """
         Initialize an 8x8 chess board.
         
-        Creates an empty board and then sets up the initial chess position.
+        Sets up the initial chess position.
+        """
+        self.reset_to_startpos()
+
+    def reset_to_startpos(self):
+        """
+        Put every piece back in the starting position.
+
+        The starting position and its bitboards are built once per process.
+        After that, resetting copies them (see copy) instead of placing
+        each piece and rebuilding the bitboards from the grid.
+        """
+        startpos = Board._startpos
+        if startpos is None:
+            startpos = Board.__new__(Board)
+            # Create 8x8 grid initialized with None (empty squares)
+            startpos.grid = [[None] * 8 for _ in range(8)]
+            startpos.setup_initial_position()
+            startpos.update_bitboards()
+            Board._startpos = startpos
+        self._copy_from(startpos)
+
+    @classmethod
+    def from_fen(cls, fen):
+        """
+        Create a board from a FEN string.
+
+        See load_fen.
+
+        Args:
+            fen (str): FEN string like '4k3/8/8/8/8/8/8/4K3 w - -'
+
+        Returns:
+            Board: New board holding the position
+        """
+        board = cls.__new__(cls)
+        board.load_fen(fen)
+        return board
+
+    def load_fen(self, fen):
+        """
+        Replace every piece with the position from a FEN string.
+
+        Only the piece placement field is read, the game has no castling
+        or en passant and the side to move is tracked by Game. Each FEN is
+        parsed once per process, after that loading copies the parsed
+        position (see copy).
+
+        Args:
+            fen (str): FEN string like '4k3/8/8/8/8/8/8/4K3 w - -',
+                       or just its piece placement field
+
+        Raises:
+            ValueError: If the piece placement is not valid FEN
         """
-        # Create 8x8 grid initialized with None (empty squares)
-        self.grid = [[None for _ in range(8)] for _ in range(8)]
-        self.setup_initial_position()
+        fields = fen.split()
+        self._copy_from(_parse_fen(fields[0] if fields else ''))
     
     def setup_initial_position(self):
         """
@@ -31,37 +132,299 @@ class Board:
         
         Places all pieces in their correct starting positions.
         """
-        # Set up white pieces
-        # All white pieces except pawns at index 0
-        self.grid[0][0] = Rook('white', 0, 0, self.grid)
-        self.grid[0][1] = Knight('white', 0, 1, self.grid)
-        self.grid[0][2] = Bishop('white', 0, 2, self.grid)
-        self.grid[0][3] = Queen('white', 0, 3, self.grid)
-        self.grid[0][4] = King('white', 0, 4, self.grid)
-        self.grid[0][5] = Bishop('white', 0, 5, self.grid)
-        self.grid[0][6] = Knight('white', 0, 6, self.grid)
-        self.grid[0][7] = Rook('white', 0, 7, self.grid)
-        
-        # Set up white pawns at index 1
-        for col in range(8):
-            self.grid[1][col] = Pawn('white', 1, col, self.grid)
-        
-        # Set up black pawns at index 6
-        for col in range(8):
-            self.grid[6][col] = Pawn('black', 6, col, self.grid)
-        
-        # Set up black pieces all but pawns at index 7
-        self.grid[7][0] = Rook('black', 7, 0, self.grid)
-        self.grid[7][1] = Knight('black', 7, 1, self.grid)
-        self.grid[7][2] = Bishop('black', 7, 2, self.grid)
-        self.grid[7][3] = Queen('black', 7, 3, self.grid)
-        self.grid[7][4] = King('black', 7, 4, self.grid)
-        self.grid[7][5] = Bishop('black', 7, 5, self.grid)
-        self.grid[7][6] = Knight('black', 7, 6, self.grid)
-        self.grid[7][7] = Rook('black', 7, 7, self.grid)
+        for piece_class, color, row, col in _INITIAL_POSITION:
+            self.grid[row][col] = piece_class(color, row, col, self.grid)
 
     def set_grid(self, grid):
+        """
+        Replace the board's grid and rebuild everything derived from it.
+
+        The bitboards, piece lists, king squares and hash are rebuilt from
+        the new grid (see update_bitboards). Writing to grid[row][col]
+        directly doesn't do this, call update_bitboards() afterwards.
+
+        Args:
+            grid (list): 8x8 grid of Piece objects and None for empty squares
+        """
+        # Pieces can be shared with the grid they were copied from (see
+        # move_piece_copy), point them back at the grid being adopted
+        for grid_row in grid:
+            for piece in grid_row:
+                if piece is not None:
+                    piece.grid = grid
         self.grid = grid
+        self.update_bitboards()
+
+    def update_bitboards(self):
+        """
+        Rebuild the piece bitboards, occupancy masks, king squares, piece lists and hash from the grid.
+
+        Called whenever the grid is replaced. Code that writes to the grid
+        directly must call this before using the bitboards or piece lists.
+        """
+        # Everything is collected in a single pass over the grid.
+        # Pieces of each color are listed by color_index, in grid order,
+        # so move generation only visits occupied squares.
+        grid = self.grid
+        bb = [0] * 12
+        occupancy = [0, 0]
+        pieces = ([], [])
+        squares = array('b', bytes(64))
+        position_hash = 0
+        piece_keys = zobrist.ZOB_PIECE
+        square = 0
+        for grid_row in grid:
+            for piece in grid_row:
+                if piece is not None:
+                    color_index = piece.color_index
+                    index = color_index * 6 + piece.type_index
+                    bit = 1 << square
+                    bb[index] |= bit
+                    occupancy[color_index] |= bit
+                    position_hash ^= piece_keys[index][square]
+                    pieces[color_index].append(piece)
+                    code = piece.type_index + 1
+                    squares[square] = -code if color_index else code
+                square += 1
+
+        self.bb = bb
+        self.pieces = pieces
+        self.occ_white, self.occ_black = occupancy
+        self.occ = self.occ_white | self.occ_black
+        # Square of each side's king (the lowest if there are several),
+        # None when that king is missing
+        self.king_squares = tuple(
+            (kings & -kings).bit_length() - 1 if kings else None
+            for kings in (self.bb[KING], self.bb[6 + KING])
+        )
+        # Zobrist hash of the piece placement, XOR zobrist.ZOB_STM for black to move
+        self.hash = position_hash
+        # Flat square codes, also read by the compiled move generator
+        self._set_squares(squares)
+
+    def _set_squares(self, squares):
+        """
+        Store the flat square codes.
+
+        With numba installed, `codes` is a numpy view sharing the memory of
+        `squares`, so the compiled generator sees every write to `squares`.
+
+        Args:
+            squares (array): array('b') of 64 square codes
+        """
+        self.squares = squares
+        if movegen_numba.NUMBA_AVAILABLE:
+            self.codes = movegen_numba.np.frombuffer(squares, dtype=movegen_numba.np.int8)
+
+    def piece_byte(self, square):
+        """
+        Get the code of the piece on a square.
+
+        The code is 0 for an empty square, otherwise the piece index plus
+        one (pawn=1 ... king=6), negative for black pieces. The same codes
+        are used by the compiled move generator.
+
+        Args:
+            square (int): Square index (0-63), row * 8 + col
+
+        Returns:
+            int: Square code (-6 to 6)
+        """
+        return self.squares[square]
+
+    def popcount(self, color):
+        """
+        Count the pieces of one color from the occupancy masks.
+
+        Args:
+            color (str): 'white' or 'black'
+
+        Returns:
+            int: Number of pieces of that color on the board
+        """
+        occupied = self.occ_white if color == 'white' else self.occ_black
+        return occupied.bit_count()
+
+    def clear_all(self):
+        """
+        Remove every piece from the board.
+
+        The grid is emptied in place, so pieces placed afterwards can keep
+        using board.grid. Bitboards, masks and the hash are reset as well.
+        """
+        for grid_row in self.grid:
+            grid_row[:] = [None] * 8
+        self.update_bitboards()
+
+    def copy(self):
+        """
+        Make an independent copy of the board.
+
+        Pieces are copied so moving them on one board can't affect the other.
+        The bitboards, masks, king squares and hash are copied as they are
+        instead of being rebuilt, so this board must be in sync with its grid.
+
+        Returns:
+            Board: The copy
+        """
+        new_board = Board.__new__(Board)
+        new_board._copy_from(self)
+        return new_board
+
+    def __copy__(self):
+        """Make copy.copy() return an independent board, see copy."""
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        """
+        Make copy.deepcopy() use copy instead of walking every attribute.
+
+        Args:
+            memo (dict): deepcopy memo, unused since copy shares nothing
+
+        Returns:
+            Board: The copy
+        """
+        return self.copy()
+
+    def _copy_from(self, other):
+        """
+        Make this board an independent copy of another board.
+
+        Args:
+            other (Board): Board in sync with its grid to copy
+        """
+        grid = [[None] * 8 for _ in range(8)]
+        pieces = ([], [])
+        for grid_row, new_row in zip(other.grid, grid):
+            for col, piece in enumerate(grid_row):
+                if piece is not None:
+                    piece = piece.copy()
+                    piece.grid = grid
+                    new_row[col] = piece
+                    pieces[piece.color_index].append(piece)
+
+        self.grid = grid
+        self.pieces = pieces
+        self.bb = list(other.bb)
+        self.occ_white = other.occ_white
+        self.occ_black = other.occ_black
+        self.occ = other.occ
+        self.king_squares = other.king_squares
+        self.hash = other.hash
+        self._set_squares(array('b', other.squares))
+
+    def is_in_check(self, color):
+        """
+        Determine if the king of the given color is in check.
+
+        Same answer as CheckDetector.is_in_check on this board's grid, but
+        uses the compiled check detector when numba is installed, otherwise
+        the tracked king square and bitboards. The board must be in sync
+        with its grid (see update_bitboards).
+
+        Args:
+            color (str): 'white' or 'black'
+
+        Returns:
+            bool: True if the king is in check, False otherwise
+        """
+        side = bitboards.COLORS.index(color)
+        if movegen_numba.NUMBA_AVAILABLE:
+            return bool(movegen_numba.in_check(self.codes, side))
+        king_square = self.king_squares[side]
+        if king_square is None:
+            return False
+        return bitboards.attackers_to(king_square, 1 - side, self.bb, self.occ) != 0
+
+    def get_legal_moves(self, color):
+        """
+        Generates every potentially legal move for one side.
+
+        Follows the same movement rules as the piece classes and
+        does NOT filter out moves that leave the king in check.
+        Uses the numba compiled generator when numba is installed,
+        otherwise the pure Python bitboard generator.
+
+        Args:
+            color (str): 'white' or 'black'
+
+        Returns:
+            list: [int] moves packed with bitboards.encode_move
+        """
+        side = bitboards.COLORS.index(color)
+        if movegen_numba.NUMBA_AVAILABLE:
+            return movegen_numba.legal_moves(self.codes, side)
+        return self._get_bitboard_moves(side)
+
+    def _get_bitboard_moves(self, side):
+        """
+        Generates every potentially legal move for one side from the bitboards.
+
+        Args:
+            side (int): 0 for white, 1 for black
+
+        Returns:
+            list: [int] moves packed with bitboards.encode_move
+        """
+        bb = self.bb[side * 6:side * 6 + 6]
+        own = self.occ_white if side == 0 else self.occ_black
+        enemy = self.occ_black if side == 0 else self.occ_white
+        occupied = self.occ
+        targets_allowed = ~own
+        encode_move = bitboards.encode_move
+        legal_moves = []
+
+        # Pawns and knights are generated a whole set at a time. Shifting a
+        # bitboard moves every piece in it at once, and the source square
+        # of each target is found by undoing the shift
+        shift = bitboards.shift
+        iter_squares = bitboards.iter_squares
+        empty = ~occupied
+        pawns = bb[PAWN]
+        if side == 0:
+            step, double_push_rank, promotion_row = 8, bitboards.RANK_3, 7
+            pawn_captures = ((7, bitboards.NOT_FILE_A), (9, bitboards.NOT_FILE_H))
+        else:
+            step, double_push_rank, promotion_row = -8, bitboards.RANK_6, 0
+            pawn_captures = ((-9, bitboards.NOT_FILE_A), (-7, bitboards.NOT_FILE_H))
+
+        # Pawns push forward onto empty squares, twice from the starting row
+        # when the first push landed on the third rank (sixth for black)
+        single_pushes = shift(pawns, step) & empty
+        double_pushes = shift(single_pushes & double_push_rank, step) & empty
+        for target in iter_squares(single_pushes):
+            # Pawns reaching the last rank always promote to a queen
+            promotion = QUEEN if target >> 3 == promotion_row else 0
+            legal_moves.append(encode_move(target - step, target, promotion))
+        for target in iter_squares(double_pushes):
+            legal_moves.append(encode_move(target - 2 * step, target))
+
+        # Pawns capture diagonally, edge files are masked so shifts can't wrap
+        for offset, source_mask in pawn_captures:
+            for target in iter_squares(shift(pawns & source_mask, offset) & enemy):
+                promotion = QUEEN if target >> 3 == promotion_row else 0
+                legal_moves.append(encode_move(target - offset, target, promotion))
+
+        # One shift per knight jump covers every knight
+        knights = bb[KNIGHT]
+        for offset, source_mask in bitboards.KNIGHT_SHIFTS:
+            for target in iter_squares(shift(knights & source_mask, offset) & targets_allowed):
+                legal_moves.append(encode_move(target - offset, target))
+
+        # Every other piece moves onto any attacked square not holding a friendly piece
+        attack_generators = (
+            (bb[BISHOP], lambda square: bitboards.bishop_attacks(square, occupied)),
+            (bb[ROOK], lambda square: bitboards.rook_attacks(square, occupied)),
+            (bb[QUEEN], lambda square: bitboards.queen_attacks(square, occupied)),
+            (bb[KING], lambda square: bitboards.KING_ATTACKS[square]),
+        )
+        for pieces, attacks in attack_generators:
+            for square in iter_squares(pieces):
+                for target in iter_squares(attacks(square) & targets_allowed):
+                    legal_moves.append(encode_move(square, target))
+
+        return legal_moves
     
     def display(self):
         """
@@ -72,32 +435,28 @@ class Board:
         Pieces shown with their character representations.
         """
 
-        board_string = ""
-        # Add column labels
-        board_string += "    A   B   C   D   E   F   G   H\n"
-        board_string += "  " + "-" * 33 + "\n"
-        board_string += "  " + "-" * 33 + "\n"
+        # Collect the pieces of the string and join them once at the end
+        parts = [_DISPLAY_HEADER]
 
         # Add from top to bottom
+        cells = _DISPLAY_CELLS
         for rank in range(7, -1, -1):
             # Add row number
-            board_string += f"{rank + 1} "
+            parts.append(_DISPLAY_RANKS[rank])
             
-            # Add each square in the rank
-            for file in range(8):
-                piece = self.grid[rank][file]
-                # Add piece character or empty space
-                piece_char = str(piece) if piece else ' '
-                board_string += f"| {piece_char} "
+            # Add each square in the rank, the cell strings are prebuilt
+            for piece in self.grid[rank]:
+                if piece is None:
+                    parts.append(_DISPLAY_EMPTY_CELL)
+                else:
+                    parts.append(cells[piece.color_index * 6 + piece.type_index])
 
-            board_string += "|\n"
-            board_string += "  " + "-" * 33 + "\n"
+            parts.append(_DISPLAY_ROW_END)
 
         # Add column labels
-        board_string += "  " + "-" * 33 + "\n"
-        board_string += "    A   B   C   D   E   F   G   H\n"
+        parts.append(_DISPLAY_FOOTER)
 
-        return board_string
+        return "".join(parts)
     
     def position_to_indices(self, position):
         """
@@ -109,27 +468,7 @@ class Board:
         Returns:
             tuple: (row, col) indices for the grid, or (None, None) if invalid
         """
-        # Convert to uppercase and strip whitespace
-        position = position.strip().upper()
-        
-        # Check if position is valid format (letter + number)
-        if len(position) != 2:
-            return None, None
-        
-        file_char = position[0]
-        rank_char = position[1]
-        
-        # Validate file (A-H) and rank (1-8)
-        if file_char not in 'ABCDEFGH' or rank_char not in '12345678':
-            return None, None
-        
-        # Convert file letter to column index
-        col = ord(file_char) - ord('A')
-        
-        # Convert rank number to row index
-        row = int(rank_char) - 1
-        
-        return row, col
+        return StaticChessMethods.uci_to_indices(position)
     
     def get_piece(self, position):
         """
@@ -146,11 +485,30 @@ class Board:
             return None
         return self.grid[row][col]
     
-    def move_piece(self, source, destination):
+    def set_piece(self, position, piece_type, color):
         """
-        Move a piece from source to destination.
+        Place a new piece on the board, replacing anything on that square.
+
+        Args:
+            position (str): Chess position like 'E2'
+            piece_type (str): 'pawn', 'knight', 'bishop', 'rook', 'queen' or 'king'
+            color (str): 'white' or 'black'
+
+        Returns:
+            Piece: The piece that was placed
+        """
+        row, col = self.position_to_indices(position)
+        piece = PIECE_CLASSES[piece_type](color, row, col, self.grid)
+        self.grid[row][col] = piece
+        self.update_bitboards()
+        return piece
+    
+    def move_piece_copy(self, source, destination):
+        """
+        Move a piece from source to destination on a copy of the grid.
         
-        This method physically moves the piece on the board.
+        The board itself is left untouched, pass the new grid to set_grid
+        to play the move. Use move_piece to move on the board directly.
         It does NOT validate if the move is legal.
         Validation will be done in a ./move_validator.py.
         
@@ -159,25 +517,20 @@ class Board:
             destination (str): Ending position like 'E4'
         
         Returns:
-            Piece or None: The captured piece if any, None otherwise
-        """
-        new_grid = [[None for _ in range(8)] for _ in range(8)]
-        for row in range(8):
-            for col in range(8):
-                cur_piece = self.grid[row][col]
-                if isinstance(cur_piece, Piece):
-                    new_grid[row][col] = cur_piece.copy()
-        for row in range(8):
-            for col in range(8):
-                cur_piece = new_grid[row][col]
-                if isinstance(cur_piece, Piece):
-                    cur_piece.set_grid(new_grid)
+            tuple: (new_grid, captured) the grid after the move and
+                   the captured Piece, or None if nothing was captured
+        """
+        # Copy the rows, not the pieces. Every piece except the moving one is
+        # shared with the current grid, so code working on new_grid must
+        # pass it to get_legal_moves() instead of relying on piece.grid
+        new_grid = [grid_row[:] for grid_row in self.grid]
 
         source_row, source_col = self.position_to_indices(source)
         dest_row, dest_col = self.position_to_indices(destination)
         
-        # Get the piece being moved
-        piece: Piece = new_grid[source_row][source_col]
+        # Copy the piece being moved so the current grid keeps its position
+        piece: Piece = new_grid[source_row][source_col].copy()
+        piece.set_grid(new_grid)
         piece.set_row_col(dest_row, dest_col)
 
         # Get any piece being captured
@@ -187,16 +540,170 @@ class Board:
         new_grid[dest_row][dest_col] = piece
         new_grid[source_row][source_col] = None
         
-        # Handle pawn promotion (pawn reaching opposite end)
-        if piece.piece_type == 'pawn':
-            # White pawn reaching index 7
-            if piece.color == 'white' and dest_row == 7:
-                new_grid[dest_row][dest_col] = Queen('white', dest_row, dest_col, new_grid)
-            # Black pawn reaching index 0
-            elif piece.color == 'black' and dest_row == 0:
-                new_grid[dest_row][dest_col] = Queen('black', dest_row, dest_col, new_grid)
+        # Handle pawn promotion (white pawn reaching index 7, black pawn reaching index 0)
+        if piece.type_index == PAWN and dest_row == piece.promotion_row:
+            new_grid[dest_row][dest_col] = Queen(piece.color, dest_row, dest_col, new_grid)
         
         return new_grid, captured
 
+    def move_piece(self, source, destination):
+        """
+        Move a piece from source to destination.
+
+        This method physically moves the piece on the board.
+        It does NOT validate if the move is legal.
+        Validation will be done in a ./move_validator.py.
+
+        Gives the same position as move_piece_copy followed by set_grid, but
+        only the two affected squares of the grid are written and the
+        bitboards, piece lists, king squares and hash are updated for
+        those squares instead of being rebuilt from the whole grid.
+        The board must be in sync with its grid (see update_bitboards).
+
+        Args:
+            source (str): Starting position like 'E2'
+            destination (str): Ending position like 'E4'
+
+        Returns:
+            Piece or None: The captured piece, or None if nothing was captured
+        """
+        source_row, source_col = self.position_to_indices(source)
+        dest_row, dest_col = self.position_to_indices(destination)
+        source_square = source_row * 8 + source_col
+        dest_square = dest_row * 8 + dest_col
+        source_bit = 1 << source_square
+        dest_bit = 1 << dest_square
+
+        grid = self.grid
+        bb = self.bb
+        piece_keys = zobrist.ZOB_PIECE
+        occupancy = [self.occ_white, self.occ_black]
+        position_hash = self.hash
+
+        piece = grid[source_row][source_col]
+        side = piece.color_index
+        captured = grid[dest_row][dest_col]
+
+        # Take the captured piece off the board
+        if captured is not None:
+            index = captured.color_index * 6 + captured.type_index
+            bb[index] ^= dest_bit
+            occupancy[captured.color_index] ^= dest_bit
+            position_hash ^= piece_keys[index][dest_square]
+            self.pieces[captured.color_index].remove(captured)
+
+        # Lift the moving piece off its source square
+        index = side * 6 + piece.type_index
+        bb[index] ^= source_bit
+        position_hash ^= piece_keys[index][source_square]
+        grid[source_row][source_col] = None
+        piece.set_row_col(dest_row, dest_col)
+
+        # Handle pawn promotion (white pawn reaching index 7, black pawn reaching index 0)
+        if piece.type_index == PAWN and dest_row == piece.promotion_row:
+            own_pieces = self.pieces[side]
+            promoted = Queen(piece.color, dest_row, dest_col, grid)
+            own_pieces[own_pieces.index(piece)] = promoted
+            piece = promoted
+            index = side * 6 + QUEEN
+
+        # Put it down on the destination square
+        grid[dest_row][dest_col] = piece
+        bb[index] |= dest_bit
+        occupancy[side] = (occupancy[side] ^ source_bit) | dest_bit
+        position_hash ^= piece_keys[index][dest_square]
+
+        self.occ_white, self.occ_black = occupancy
+        self.occ = self.occ_white | self.occ_black
+        self.hash = position_hash
+
+        # King squares only change when a king moves or is captured
+        if piece.type_index == KING or (captured is not None and captured.type_index == KING):
+            self.king_squares = tuple(
+                (kings & -kings).bit_length() - 1 if kings else None
+                for kings in (bb[KING], bb[6 + KING])
+            )
+        code = index % 6 + 1
+        self.squares[source_square] = 0
+        self.squares[dest_square] = code if side == 0 else -code
+
+        return captured
+
+    def apply_moves(self, moves):
+        """
+        Play a sequence of moves directly on this board.
+
+        Gives the same position as calling move_piece for each move, but
+        the bitboards are rebuilt once at the end instead of being updated
+        after every move, so the grid may have been edited directly.
+        Like move_piece, it does NOT validate the moves.
+
+        Args:
+            moves (list): [(source, destination)] like [('E2', 'E4')]
+
+        Returns:
+            list: The captured Piece (or None) for each move
+        """
+        grid = self.grid
+        captured_pieces = []
+        for source, destination in moves:
+            source_row, source_col = self.position_to_indices(source)
+            dest_row, dest_col = self.position_to_indices(destination)
+
+            piece = grid[source_row][source_col]
+            captured_pieces.append(grid[dest_row][dest_col])
+            grid[source_row][source_col] = None
+            piece.set_row_col(dest_row, dest_col)
+
+            # Handle pawn promotion the same way move_piece does
+            if piece.type_index == PAWN and dest_row == piece.promotion_row:
+                piece = Queen(piece.color, dest_row, dest_col, grid)
+            grid[dest_row][dest_col] = piece
+
+        self.update_bitboards()
+        return captured_pieces
+
     def __repr__(self):
         return self.display()
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_fen(placement):
+    """
+    Build a board from the piece placement field of a FEN string.
+
+    The result is cached, callers must copy it rather than change it.
+
+    Args:
+        placement (str): Ranks 8 to 1 separated by '/', like '4k3/8/8/8/8/8/8/4K3'
+
+    Returns:
+        Board: Board holding the position, in sync with its grid
+
+    Raises:
+        ValueError: If the piece placement is not valid FEN
+    """
+    ranks = placement.split('/')
+    if len(ranks) != 8:
+        raise ValueError(f"FEN needs 8 ranks: {placement!r}")
+
+    grid = [[None] * 8 for _ in range(8)]
+    # FEN lists rank 8 first, which is grid row 7
+    for row, rank in zip(range(7, -1, -1), ranks):
+        col = 0
+        for char in rank:
+            if char in '12345678':
+                col += int(char)
+                continue
+            piece_class = _FEN_PIECES.get(char.lower())
+            if piece_class is None or col > 7:
+                raise ValueError(f"Invalid FEN rank {rank!r}: {placement!r}")
+            color = 'white' if char.isupper() else 'black'
+            grid[row][col] = piece_class(color, row, col, grid)
+            col += 1
+        if col != 8:
+            raise ValueError(f"FEN rank {rank!r} does not cover 8 squares: {placement!r}")
+
+    board = Board.__new__(Board)
+    board.set_grid(grid)
+    return board
@@ -3,13 +3,17 @@ Detects when a king is in check.
 
 Defines the CheckDetector class which determines if a king is under attack (in check) by any enemy piece.
 """
+from . import bitboards
+from . import movegen_numba
+from .pieces import COLOR_INDEX
+from .static_chess_methods import StaticChessMethods
 
 class CheckDetector:
     """
     Detects check situations on the board.
     
-    Checks if a king is under attack by examining all enemy pieces
-    to see if any can legally move to the king's position.
+    Checks if a king is under attack by looking backwards from the king's
+    square for enemy pieces that attack it, using bitboards.
     """
     
     @staticmethod
@@ -23,10 +27,12 @@ class CheckDetector:
         Returns:
             tuple: (row, col) of the king's position, or (None, None) if not found
         """
-        for row in range(8):
-            for col in range(8):
-                piece = grid[row][col]
-                if piece and piece.piece_type == 'king' and piece.color == color:
+        # Compare the integer indices rather than the type and color strings
+        side = COLOR_INDEX[color]
+        for row, grid_row in enumerate(grid):
+            for col, piece in enumerate(grid_row):
+                if (piece is not None and piece.type_index == bitboards.KING
+                        and piece.color_index == side):
                     return row, col
         return None, None
 
@@ -36,6 +42,10 @@ class CheckDetector:
         Determine if a king of the given color is in check.
         
         A king is in check if any enemy piece can legally move to its position.
+        Rather than generating every enemy move, the enemy pieces that
+        attack the king's square are found by looking backwards from the
+        king, in compiled code when numba is installed and otherwise
+        with a few bitboard lookups.
         
         Args:
             color (str): 'white' or 'black'
@@ -43,34 +53,110 @@ class CheckDetector:
         Returns:
             bool: True if the king is in check, False otherwise
         """
-        # Find the king
-        king_row, king_col = CheckDetector.find_king(color, grid)
-        
+        side = COLOR_INDEX[color]
+        if movegen_numba.NUMBA_AVAILABLE:
+            return bool(movegen_numba.in_check(movegen_numba.grid_to_codes(grid), side))
+
+        bb = bitboards.grid_to_bitboards(grid)
+        occupied = 0
+        for bitboard in bb:
+            occupied |= bitboard
+        return CheckDetector._king_attacked(side, bb, occupied)
+
+    @staticmethod
+    def both_in_check(grid):
+        """
+        Determine for both colors whether their king is in check.
+
+        Same answers as calling is_in_check for 'white' and for 'black',
+        but the grid is converted to square codes or bitboards only once.
+
+        Args:
+            grid (list): 8x8 grid of Piece objects or None
+
+        Returns:
+            tuple: (white_in_check, black_in_check)
+        """
+        if movegen_numba.NUMBA_AVAILABLE:
+            codes = movegen_numba.grid_to_codes(grid)
+            return bool(movegen_numba.in_check(codes, 0)), bool(movegen_numba.in_check(codes, 1))
+
+        bb = bitboards.grid_to_bitboards(grid)
+        occupied = 0
+        for bitboard in bb:
+            occupied |= bitboard
+        return (CheckDetector._king_attacked(0, bb, occupied),
+                CheckDetector._king_attacked(1, bb, occupied))
+
+    @staticmethod
+    def _king_attacked(side, bb, occupied):
+        """
+        Check whether a side's king is attacked, from the piece bitboards.
+
+        Args:
+            side (int): 0 for white, 1 for black
+            bb (list): 12 bitboards indexed by color * 6 + piece index
+            occupied (int): Bitboard of every occupied square
+
+        Returns:
+            bool: True if the king is in check, False if it is safe or missing
+        """
+        # Find the king, the lowest set bit matches the first king find_king would see
+        kings = bb[side * 6 + bitboards.KING]
+
         # If king not found (captured), return False
-        if king_row is None:
+        if not kings:
             return False
-        
-        # Convert king position to chess notation
-        king_pos = CheckDetector.indices_to_position(king_row, king_col)
-        
-        # Determine enemy color
-        enemy_color = 'black' if color == 'white' else 'white'
-        
-        # Check all squares for enemy pieces
-        for row in range(8):
-            for col in range(8):
-                piece = grid[row][col]
-                
-                # Skip if square is empty or contains friendly piece
-                if piece is None or piece.color != enemy_color:
-                    continue
-                
-                piece_legal_moves = piece.get_legal_moves()
-
-                if king_pos in piece_legal_moves:
-                    return True
-
-        return False
+        king_square = (kings & -kings).bit_length() - 1
+
+        # The king is in check when any enemy piece attacks its square
+        return bitboards.attackers_to(king_square, 1 - side, bb, occupied) != 0
+
+    @staticmethod
+    def move_leaves_king_in_check(board, color, source_square, dest_square):
+        """
+        Determine if a move would leave the mover's own king in check.
+
+        Gives the same answer as applying the move with Board.move_piece_copy and
+        calling is_in_check on the new grid, but works on the board's
+        bitboards and tracked king squares so no grid has to be copied.
+
+        Args:
+            board (Board): Board with up to date bitboards (see Board.update_bitboards)
+            color (str): 'white' or 'black', the side making the move
+            source_square (int): Square index the piece moves from (0-63)
+            dest_square (int): Square index the piece moves to (0-63)
+
+        Returns:
+            bool: True if the king would be in check after the move
+        """
+        side = COLOR_INDEX[color]
+        enemy = 1 - side
+        bb = board.bb
+        source_bit = 1 << source_square
+        dest_bit = 1 << dest_square
+
+        # The king square only changes when the king itself moves
+        kings = bb[side * 6 + bitboards.KING]
+        if kings & source_bit:
+            kings ^= source_bit | dest_bit
+            king_square = (kings & -kings).bit_length() - 1 if kings else None
+        else:
+            king_square = board.king_squares[side]
+
+        # If king not found (captured), return False
+        if king_square is None:
+            return False
+
+        # A captured enemy piece no longer attacks anything
+        enemy_occupied = board.occ_black if side == 0 else board.occ_white
+        if enemy_occupied & dest_bit:
+            bb = list(bb)
+            for index in range(enemy * 6, enemy * 6 + 6):
+                bb[index] &= ~dest_bit
+
+        occupied = (board.occ & ~source_bit) | dest_bit
+        return bitboards.attackers_to(king_square, enemy, bb, occupied) != 0
 
     @staticmethod
     def indices_to_position(row, col):
@@ -84,6 +170,4 @@ class CheckDetector:
         Returns:
             str: Chess position like 'E2'
         """
-        file = chr(ord('A') + col)
-        rank = str(row + 1)
-        return file + rank
\ No newline at end of file
+        return StaticChessMethods.indices_to_uci(row, col)
\ No newline at end of file
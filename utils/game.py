@@ -27,7 +27,40 @@ class Game:
         self.move_validator = MoveValidator(self.board)
         self.current_player = 'white'
         self.game_over = False
-    
+
+    def copy(self):
+        """
+        Make an independent copy of the game.
+
+        The board is copied with Board.copy and gets its own validator,
+        whose move cache starts empty.
+
+        Returns:
+            Game: The copy
+        """
+        new_game = Game.__new__(Game)
+        new_game.board = self.board.copy()
+        new_game.move_validator = MoveValidator(new_game.board)
+        new_game.current_player = self.current_player
+        new_game.game_over = self.game_over
+        return new_game
+
+    def __copy__(self):
+        """Make copy.copy() return an independent game, see copy."""
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        """
+        Make copy.deepcopy() use copy instead of walking every attribute.
+
+        Args:
+            memo (dict): deepcopy memo, unused since copy shares nothing
+
+        Returns:
+            Game: The copy
+        """
+        return self.copy()
+
     def start(self):
         """
         Start the game and run the main game loop.
@@ -53,7 +86,7 @@ class Game:
         Cycles one turn. Checks for check, prompts for move, validates it, executes it, and switches players.
         """
         # Check if current player's king is in check
-        check = CheckDetector.is_in_check(self.current_player, self.board.grid)
+        check = self.board.is_in_check(self.current_player)
         legal_moves = self.move_validator.generate_valid_moves(self.current_player)
         # If there are no legal moves, end the game
         if len(legal_moves) == 0:
@@ -89,9 +122,7 @@ class Game:
             return
         
         # Execute the move
-        new_state, captured_piece = self.board.move_piece(source, destination)
-
-        self.board.set_grid(new_state)
+        captured_piece = self.board.move_piece(source, destination)
         
         # Check if a king was captured
         if captured_piece and captured_piece.piece_type == 'king':
@@ -128,25 +159,11 @@ class Game:
         Returns:
             tuple: (source, destination) as strings, or (None, None) if invalid
         """
-        parts = None
-        
-        move_input = move_input.strip()
-
-        if ', ' in move_input:
-            parts = move_input.split(', ')
-        elif ',' in move_input:
-            parts = move_input.split(',')
-        elif '-' in move_input:
-            parts = move_input.split('-')
-        elif ' ' in move_input:
-            parts = move_input.split()
-        else:
-            return None, None
+        # Commas and dashes become spaces so one split handles every
+        # separator, uppercasing first puts both squares in the 'E2' form
+        parts = move_input.upper().replace(',', ' ').replace('-', ' ').split()
 
         if len(parts) != 2:
             return None, None
-        
-        source = parts[0].strip().upper()
-        destination = parts[1].strip().upper()
-        
-        return source, destination
\ No newline at end of file
+
+        return parts[0], parts[1]
\ No newline at end of file
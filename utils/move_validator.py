@@ -3,8 +3,62 @@ Validates chess moves according to piece movement rules.
 
 Defines the MoveValidator class which checks if a move is legal based on the piece type, board state, and chess rules.
 """
+import sys
+from enum import IntEnum
+
+from . import movegen_numba
+from . import zobrist
 from .board import Board
 from .check_detector import CheckDetector
+from .pieces import COLOR_INDEX
+from .static_chess_methods import StaticChessMethods
+
+# Number of positions a validator keeps generated moves for,
+# the cache starts over once it is full
+MOVE_CACHE_SIZE = 1024
+
+# Name of every square by square index (row * 8 + col), for turning packed moves into 'E2 E4'
+_SQUARE_NAMES = tuple(
+    StaticChessMethods.indices_to_uci(square >> 3, square & 7) for square in range(64)
+)
+
+# Error messages returned by is_valid_move. Interned module constants, so a
+# caller comparing against the same constant matches on identity
+ERR_INVALID_POSITION = sys.intern("Invalid position format")
+ERR_KING_JEOPARDY = sys.intern("Can't put your king in jeopardy")
+ERR_NO_PIECE = sys.intern("No piece at source position")
+ERR_NOT_YOUR_PIECE = sys.intern("That's not your piece")
+ERR_SAME_SQUARE = sys.intern("Source and destination are the same")
+ERR_OWN_CAPTURE = sys.intern("Cannot capture your own piece")
+ERR_PATH_BLOCKED = sys.intern("That path is blocked")
+ERR_UNKNOWN = sys.intern("Unknown piece type")
+
+
+class MoveError(IntEnum):
+    """Result codes of MoveValidator.check_move, OK for a valid move."""
+    OK = 0
+    INVALID_POSITION = 1
+    NO_PIECE = 2
+    NOT_YOUR_PIECE = 3
+    SAME_SQUARE = 4
+    OWN_CAPTURE = 5
+    KING_JEOPARDY = 6
+    PATH_BLOCKED = 7
+    UNKNOWN = 8
+
+
+# Message for each MoveError, indexed by its value
+ERROR_MESSAGES = (
+    "",
+    ERR_INVALID_POSITION,
+    ERR_NO_PIECE,
+    ERR_NOT_YOUR_PIECE,
+    ERR_SAME_SQUARE,
+    ERR_OWN_CAPTURE,
+    ERR_KING_JEOPARDY,
+    ERR_PATH_BLOCKED,
+    ERR_UNKNOWN,
+)
 
 class MoveValidator:
     """
@@ -17,6 +71,11 @@ class MoveValidator:
     
     Does NOT check for check/checkmate or prevent self-check.
     Check detection is done in ./check_detector.py.
+
+    Moves are generated from the board's bitboards and cached by its hash,
+    which the Board methods keep in sync with the grid. Code that writes
+    to board.grid directly must call board.update_bitboards() before
+    validating, otherwise moves are checked against the old position.
     """
     
     def __init__(self, board):
@@ -27,20 +86,66 @@ class MoveValidator:
             board (Board): The chess board to validate moves on
         """
         self.board : Board = board
+        # generate_valid_moves results as tuples keyed by the position's
+        # Zobrist hash, with zobrist.ZOB_STM XORed in when black is to move
+        self._move_cache = {}
 
     def generate_valid_moves(self, current_player):
-        legal_moves = []
-        king_in_check_moves = []
-        for row in range(8):
-            for col in range(8):
-                piece = self.board.grid[row][col]
-                if not piece is None and piece.color == current_player:
-                    for potential_move in piece.get_legal_moves():
-                        new_grid, _ = self.board.move_piece(piece.get_uci_pos(), potential_move)
-                        if not CheckDetector.is_in_check(current_player, new_grid):
-                            legal_moves.append(piece.get_uci_pos() + " " + potential_move)
-                        else:
-                            king_in_check_moves.append(piece.get_uci_pos() + " " + potential_move)
+        """
+        Generate every legal move for a player.
+
+        The board's mutators keep its bitboards and hash in sync, so the
+        validator stays valid across moves and never needs to be rebuilt.
+        Code that edits board.grid directly must call
+        Board.update_bitboards() first. Results are cached by Zobrist hash,
+        so asking again about a position already seen (as play_turn and
+        is_valid_move do) is a dict lookup plus a copy of the two lists.
+        The copies keep callers from changing the cached moves.
+
+        Args:
+            current_player (str): 'white' or 'black'
+
+        Returns:
+            tuple: (legal_moves, king_in_check_moves) lists of moves like 'E2 E4',
+                   the second holding moves rejected for leaving the king in check
+        """
+        key = self.board.hash
+        if current_player == 'black':
+            key ^= zobrist.ZOB_STM
+        cached = self._move_cache.get(key)
+        if cached is not None:
+            return list(cached[0]), list(cached[1])
+
+        board = self.board
+        # Candidate moves come from the move generator as packed ints,
+        # see bitboards.encode_move
+        if movegen_numba.NUMBA_AVAILABLE:
+            # Generated and checked for self-check in one compiled call
+            safe_moves, unsafe_moves = movegen_numba.split_safe_moves(
+                board.codes, COLOR_INDEX[current_player]
+            )
+        else:
+            safe_moves = []
+            unsafe_moves = []
+            for move in board.get_legal_moves(current_player):
+                # Check the move on the bitboards instead of copying the grid
+                if not CheckDetector.move_leaves_king_in_check(
+                    board, current_player, move & 63, move >> 6 & 63
+                ):
+                    safe_moves.append(move)
+                else:
+                    unsafe_moves.append(move)
+
+        names = _SQUARE_NAMES
+        legal_moves = [names[move & 63] + " " + names[move >> 6 & 63] for move in safe_moves]
+        king_in_check_moves = [
+            names[move & 63] + " " + names[move >> 6 & 63] for move in unsafe_moves
+        ]
+
+        if len(self._move_cache) >= MOVE_CACHE_SIZE:
+            self._move_cache.clear()
+        # Stored as tuples so the cached moves cannot be changed in place
+        self._move_cache[key] = (tuple(legal_moves), tuple(king_in_check_moves))
         return legal_moves, king_in_check_moves
     
     def is_valid_move(self, source: str, destination: str, current_player: str):
@@ -57,51 +162,68 @@ class MoveValidator:
                    is_valid is True if move is legal, False otherwise
                    error_message explains why move is invalid
         """
+        error = self.check_move(source, destination, current_player)
+        return error == MoveError.OK, ERROR_MESSAGES[error]
+
+    def check_move(self, source: str, destination: str, current_player: str):
+        """
+        Check if a move is valid, returning a result code instead of a message.
+
+        Args:
+            source (str): Starting position like 'E2'
+            destination (str): Ending position like 'E4'
+            current_player (str): 'white' or 'black'
+
+        Returns:
+            MoveError: MoveError.OK if the move is legal, otherwise the reason it is invalid
+        """
         # Convert positions to indices
         source_row, source_col = self.board.position_to_indices(source)
         dest_row, dest_col = self.board.position_to_indices(destination)
         
         # Check if positions are valid
         if source_row is None or dest_row is None:
-            return False, "Invalid position format"
-        
-        legal_moves, king_in_check_moves = self.generate_valid_moves(current_player)
+            return MoveError.INVALID_POSITION
 
-        potential_move = source + " " + destination
-
-        if potential_move in legal_moves:
-            return True, ""
-
-        if potential_move in king_in_check_moves:
-            return False, "Can't put your king in jeopardy"
-
-        # Get the piece at source
-        piece = self.board.get_piece(source)
+        # The checks below reject moves the generator would never produce,
+        # so they run first and skip move generation entirely
+        grid = self.board.grid
+        piece = grid[source_row][source_col]
         
         # Check if there's a piece at source
         if piece is None:
-            return False, "No piece at source position"
+            return MoveError.NO_PIECE
         
         # Check if it's the correct player's piece
         if piece.color != current_player:
-            return False, "That's not your piece"
+            return MoveError.NOT_YOUR_PIECE
         
         # Check if source and destination are the same
         if source_row == dest_row and source_col == dest_col:
-            return False, "Source and destination are the same"
+            return MoveError.SAME_SQUARE
         
         # Get destination piece (if any)
-        dest_piece = self.board.get_piece(destination)
+        dest_piece = grid[dest_row][dest_col]
         
         # Check if trying to capture own piece
         if dest_piece and dest_piece.color == current_player:
-            return False, "Cannot capture your own piece"
+            return MoveError.OWN_CAPTURE
+
+        legal_moves, king_in_check_moves = self.generate_valid_moves(current_player)
+
+        potential_move = source + " " + destination
+
+        if potential_move in legal_moves:
+            return MoveError.OK
+
+        if potential_move in king_in_check_moves:
+            return MoveError.KING_JEOPARDY
 
         # Check if trying to move through another piece
         if self._path_is_blocked(piece, source_row, source_col, dest_row, dest_col):
-            return False, "That path is blocked"
+            return MoveError.PATH_BLOCKED
         
-        return False, "Unknown piece type"
+        return MoveError.UNKNOWN
     
     def _path_is_blocked(self, piece, source_row, source_col, dest_row, dest_col):
         """Checks whether there's a piece on the path `piece` wants to travel along.
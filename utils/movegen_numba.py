@@ -0,0 +1,346 @@
+"""
+Numba compiled move generation.
+
+Generates potentially legal moves from a flat array of 64 square codes
+instead of Piece objects, so the whole generator compiles to machine code.
+A square code is 0 for an empty square, otherwise the piece index
+(pawn=1 ... king=6) made negative for black pieces.
+Moves are written as integers packed the same way as bitboards.encode_move.
+
+numba and numpy are optional. When either is missing NUMBA_AVAILABLE is
+False and callers should use the pure Python bitboard generator instead.
+"""
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    np = None
+    njit = None
+    NUMBA_AVAILABLE = False
+
+from array import array
+
+from .bitboards import QUEEN
+
+# Upper bound on generated moves: every square holding a queen with 27 moves
+MAX_MOVES = 64 * 27
+
+if NUMBA_AVAILABLE:
+    KNIGHT_OFFSETS = np.array(
+        [[-2, -1], [-2, 1], [-1, -2], [-1, 2], [1, -2], [1, 2], [2, -1], [2, 1]],
+        dtype=np.int64,
+    )
+    KING_OFFSETS = np.array(
+        [[-1, -1], [-1, 0], [-1, 1], [0, -1], [0, 1], [1, -1], [1, 0], [1, 1]],
+        dtype=np.int64,
+    )
+    ROOK_DIRECTIONS = np.array([[1, 0], [-1, 0], [0, 1], [0, -1]], dtype=np.int64)
+    BISHOP_DIRECTIONS = np.array([[1, 1], [1, -1], [-1, 1], [-1, -1]], dtype=np.int64)
+    QUEEN_DIRECTIONS = np.concatenate((ROOK_DIRECTIONS, BISHOP_DIRECTIONS))
+
+
+def _jit(func):
+    """Compile `func` with numba when it is installed."""
+    if njit is None:
+        return func
+    return njit(cache=True)(func)
+
+
+@_jit
+def _pawn_moves(codes, square, sign, out, n):
+    """Add pawn pushes and diagonal captures, returns the new move count."""
+    row = square // 8
+    col = square % 8
+    forward_row = row + sign
+    if forward_row < 0 or forward_row > 7:
+        return n
+
+    # Pawns reaching the last rank always promote to a queen
+    promotion = 0
+    if forward_row == 0 or forward_row == 7:
+        promotion = QUEEN << 12
+
+    forward = forward_row * 8 + col
+    if codes[forward] == 0:
+        out[n] = square | forward << 6 | promotion
+        n += 1
+        # Double move from the starting row when both squares are empty
+        starting_row = 1 if sign > 0 else 6
+        if row == starting_row:
+            double = forward + 8 * sign
+            if codes[double] == 0:
+                out[n] = square | double << 6
+                n += 1
+
+    for col_offset in (-1, 1):
+        cur_col = col + col_offset
+        if cur_col < 0 or cur_col > 7:
+            continue
+        target = forward_row * 8 + cur_col
+        # Opposite signs means an enemy piece
+        if codes[target] * sign < 0:
+            out[n] = square | target << 6 | promotion
+            n += 1
+    return n
+
+
+@_jit
+def _leaper_moves(codes, square, sign, offsets, out, n):
+    """Add knight or king moves, returns the new move count."""
+    row = square // 8
+    col = square % 8
+    for i in range(offsets.shape[0]):
+        cur_row = row + offsets[i, 0]
+        cur_col = col + offsets[i, 1]
+        if cur_row < 0 or cur_row > 7 or cur_col < 0 or cur_col > 7:
+            continue
+        target = cur_row * 8 + cur_col
+        # Empty square or enemy piece
+        if codes[target] * sign <= 0:
+            out[n] = square | target << 6
+            n += 1
+    return n
+
+
+@_jit
+def _slider_moves(codes, square, sign, directions, out, n):
+    """Add bishop, rook or queen moves, returns the new move count."""
+    row = square // 8
+    col = square % 8
+    for i in range(directions.shape[0]):
+        cur_row = row + directions[i, 0]
+        cur_col = col + directions[i, 1]
+        while 0 <= cur_row <= 7 and 0 <= cur_col <= 7:
+            target = cur_row * 8 + cur_col
+            code = codes[target]
+            if code * sign <= 0:
+                out[n] = square | target << 6
+                n += 1
+            # Stop the ray at the first piece
+            if code != 0:
+                break
+            cur_row += directions[i, 0]
+            cur_col += directions[i, 1]
+    return n
+
+
+@_jit
+def gen_moves(codes, side, out):
+    """
+    Generate every potentially legal move for one side.
+
+    Args:
+        codes (np.ndarray): int8[64] square codes
+        side (int): 0 for white, 1 for black
+        out (np.ndarray): int32[MAX_MOVES] buffer receiving the encoded moves
+
+    Returns:
+        int: Number of moves written to `out`
+    """
+    sign = 1 if side == 0 else -1
+    n = 0
+    for square in range(64):
+        piece = codes[square] * sign
+        if piece <= 0:
+            continue
+        if piece == 1:
+            n = _pawn_moves(codes, square, sign, out, n)
+        elif piece == 2:
+            n = _leaper_moves(codes, square, sign, KNIGHT_OFFSETS, out, n)
+        elif piece == 3:
+            n = _slider_moves(codes, square, sign, BISHOP_DIRECTIONS, out, n)
+        elif piece == 4:
+            n = _slider_moves(codes, square, sign, ROOK_DIRECTIONS, out, n)
+        elif piece == 5:
+            n = _slider_moves(codes, square, sign, QUEEN_DIRECTIONS, out, n)
+        else:
+            n = _leaper_moves(codes, square, sign, KING_OFFSETS, out, n)
+    return n
+
+
+@_jit
+def square_attacked(codes, square, sign):
+    """
+    Check whether any piece of one side attacks a square.
+
+    Args:
+        codes (np.ndarray): int8[64] square codes
+        square (int): Square index being attacked (0-63)
+        sign (int): 1 for white attackers, -1 for black attackers
+
+    Returns:
+        bool: True if the square is attacked
+    """
+    row = square // 8
+    col = square % 8
+
+    # Pawns attack from one row behind, on either neighbouring column
+    pawn_row = row - sign
+    if 0 <= pawn_row <= 7:
+        for col_offset in (-1, 1):
+            cur_col = col + col_offset
+            if 0 <= cur_col <= 7 and codes[pawn_row * 8 + cur_col] == sign:
+                return True
+
+    # Knights and kings, the offsets are symmetric so they work backwards too
+    for i in range(8):
+        cur_row = row + KNIGHT_OFFSETS[i, 0]
+        cur_col = col + KNIGHT_OFFSETS[i, 1]
+        if 0 <= cur_row <= 7 and 0 <= cur_col <= 7:
+            if codes[cur_row * 8 + cur_col] == 2 * sign:
+                return True
+        cur_row = row + KING_OFFSETS[i, 0]
+        cur_col = col + KING_OFFSETS[i, 1]
+        if 0 <= cur_row <= 7 and 0 <= cur_col <= 7:
+            if codes[cur_row * 8 + cur_col] == 6 * sign:
+                return True
+
+    # Sliding pieces, only the first piece on each ray matters.
+    # Rook directions come first in QUEEN_DIRECTIONS, then bishop directions
+    for i in range(8):
+        slider = 4 * sign if i < 4 else 3 * sign
+        cur_row = row + QUEEN_DIRECTIONS[i, 0]
+        cur_col = col + QUEEN_DIRECTIONS[i, 1]
+        while 0 <= cur_row <= 7 and 0 <= cur_col <= 7:
+            code = codes[cur_row * 8 + cur_col]
+            if code != 0:
+                if code == slider or code == 5 * sign:
+                    return True
+                break
+            cur_row += QUEEN_DIRECTIONS[i, 0]
+            cur_col += QUEEN_DIRECTIONS[i, 1]
+    return False
+
+
+@_jit
+def in_check(codes, side):
+    """
+    Check whether a side's king is attacked.
+
+    Args:
+        codes (np.ndarray): int8[64] square codes
+        side (int): 0 for white, 1 for black
+
+    Returns:
+        bool: True if the king is in check, False if it is safe or missing
+    """
+    sign = 1 if side == 0 else -1
+    for square in range(64):
+        if codes[square] == 6 * sign:
+            return square_attacked(codes, square, -sign)
+    return False
+
+
+@_jit
+def gen_safe_moves(codes, side, out, safe):
+    """
+    Generate every potentially legal move for one side and flag the ones
+    that don't leave its king in check.
+
+    Each move is played on a scratch copy of `codes`, checked with in_check
+    and taken back. The moved piece keeps its code on promotion, since only
+    enemy pieces decide whether the king is attacked.
+
+    Args:
+        codes (np.ndarray): int8[64] square codes
+        side (int): 0 for white, 1 for black
+        out (np.ndarray): int32[MAX_MOVES] buffer receiving the encoded moves
+        safe (np.ndarray): bool[MAX_MOVES] buffer, set True for moves that
+                           leave the king safe (or when there is no king)
+
+    Returns:
+        int: Number of moves written to `out`
+    """
+    n = gen_moves(codes, side, out)
+    work = codes.copy()
+    for i in range(n):
+        source = out[i] & 63
+        dest = out[i] >> 6 & 63
+        captured = work[dest]
+        work[dest] = work[source]
+        work[source] = 0
+        safe[i] = not in_check(work, side)
+        work[source] = work[dest]
+        work[dest] = captured
+    return n
+
+
+def grid_to_codes(grid):
+    """
+    Build the square code array from an 8x8 grid of pieces.
+
+    Args:
+        grid (list): 8x8 grid of Piece objects or None
+
+    Returns:
+        np.ndarray: int8[64] square codes
+    """
+    squares = array('b', bytes(64))
+    square = 0
+    for grid_row in grid:
+        for piece in grid_row:
+            if piece is not None:
+                code = piece.type_index + 1
+                squares[square] = -code if piece.color_index else code
+            square += 1
+    return np.frombuffer(squares, dtype=np.int8)
+
+
+def legal_moves(codes, side):
+    """
+    Run the compiled generator and convert the result to Python ints.
+
+    Args:
+        codes (np.ndarray): int8[64] square codes
+        side (int): 0 for white, 1 for black
+
+    Returns:
+        list: [int] moves packed with bitboards.encode_move
+    """
+    out = np.empty(MAX_MOVES, dtype=np.int32)
+    n = gen_moves(codes, side, out)
+    return out[:n].tolist()
+
+
+def warmup():
+    """
+    Compile every numba function, or load it from numba's on-disk cache.
+
+    Otherwise the first call of each function pays that cost, which is a
+    few seconds when nothing is cached yet. Callers timing the code, like
+    the test runner, call this first. Does nothing when numba is missing.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    # Kings on E1 and E8, built the same way as Board's codes so the
+    # compiled argument types match
+    squares = array('b', bytes(64))
+    squares[4] = 6
+    squares[60] = -6
+    codes = np.frombuffer(squares, dtype=np.int8)
+    for side in (0, 1):
+        legal_moves(codes, side)
+        split_safe_moves(codes, side)
+        in_check(codes, side)
+
+
+def split_safe_moves(codes, side):
+    """
+    Run the compiled generator and check filter, and convert the result to Python ints.
+
+    Args:
+        codes (np.ndarray): int8[64] square codes
+        side (int): 0 for white, 1 for black
+
+    Returns:
+        tuple: (safe_moves, unsafe_moves) lists of [int] moves packed with
+               bitboards.encode_move, in generation order, the second
+               holding moves that leave the king in check
+    """
+    out = np.empty(MAX_MOVES, dtype=np.int32)
+    safe = np.empty(MAX_MOVES, dtype=np.bool_)
+    n = gen_safe_moves(codes, side, out, safe)
+    moves = out[:n]
+    safe = safe[:n]
+    return moves[safe].tolist(), moves[~safe].tolist()
@@ -1,5 +1,133 @@
+import sys
 from abc import ABC, abstractmethod
 from .static_chess_methods import StaticChessMethods
+from .bitboards import Color, PieceType
+
+# Integer index of each color, compared in move generation instead of the color strings.
+# Plain ints rather than Color members keep arithmetic on them on the fast path
+COLOR_INDEX = {'white': int(Color.WHITE), 'black': int(Color.BLACK)}
+
+# Interned color names, indexed by color_index. Pieces always store one of
+# these exact objects, even when built from a string made at runtime (like
+# user input), so comparing colors succeeds on the identity check
+WHITE = sys.intern('white')
+BLACK = sys.intern('black')
+COLOR_NAMES = (WHITE, BLACK)
+
+
+def _build_target_table(offsets):
+    """
+    Precompute the on-board destinations of a piece that jumps by fixed offsets.
+
+    Args:
+        offsets (tuple): (row_offset, col_offset) pairs
+
+    Returns:
+        tuple: 64 entries indexed by row * 8 + col, each a tuple of (row, col) destinations
+    """
+    table = []
+    for row in range(8):
+        for col in range(8):
+            table.append(tuple(
+                (row + row_offset, col + col_offset)
+                for row_offset, col_offset in offsets
+                if 0 <= row + row_offset <= 7 and 0 <= col + col_offset <= 7
+            ))
+    return tuple(table)
+
+
+# Bounds checks are resolved once here instead of on every move generation
+KNIGHT_TARGETS = _build_target_table(
+    ((-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1))
+)
+KING_TARGETS = _build_target_table(
+    ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, 1), (-1, -1), (1, 1), (1, -1))
+)
+
+# (row, col) steps of the sliding pieces, the queen uses both
+ROOK_DIRS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+BISHOP_DIRS = ((-1, 1), (-1, -1), (1, 1), (1, -1))
+QUEEN_DIRS = ROOK_DIRS + BISHOP_DIRS
+
+# Template for a ray walker with its direction baked in. The step and the
+# edge check become constants, so the loop does no multiplication and
+# reads no direction variables.
+_RAY_TEMPLATE = """
+def _ray(row, col, color_index, grid, legal_moves, to_uci):
+    while {bounds}:
+{steps}
+        # Only None or a Piece can sit on a square
+        capture_piece = grid[row][col]
+        if capture_piece is None:
+            legal_moves.append(to_uci(row, col))
+        else:
+            if capture_piece.color_index != color_index:
+                legal_moves.append(to_uci(row, col))
+            return
+"""
+
+
+def _build_ray(row_step, col_step):
+    """
+    Compile a function walking one ray from a square.
+
+    The generated function appends the uci string of every square along
+    the ray up to the edge of the board or the first piece, which is
+    included as a capture when it belongs to the enemy.
+
+    Args:
+        row_step (int): -1, 0 or 1
+        col_step (int): -1, 0 or 1
+
+    Returns:
+        function: _ray(row, col, color_index, grid, legal_moves, to_uci)
+    """
+    bounds = []
+    steps = []
+    for name, step in (('row', row_step), ('col', col_step)):
+        if step:
+            # Stop before stepping off the board
+            bounds.append(f'{name} < 7' if step > 0 else f'{name} > 0')
+            steps.append(f'        {name} += {step}')
+    namespace = {}
+    source = _RAY_TEMPLATE.format(bounds=' and '.join(bounds), steps='\n'.join(steps))
+    exec(source, namespace)
+    return namespace['_ray']
+
+
+# One specialized walker per direction, in the same order as the *_DIRS tuples
+RAYS = {direction: _build_ray(*direction) for direction in QUEEN_DIRS}
+ROOK_RAYS = tuple(RAYS[direction] for direction in ROOK_DIRS)
+BISHOP_RAYS = tuple(RAYS[direction] for direction in BISHOP_DIRS)
+QUEEN_RAYS = ROOK_RAYS + BISHOP_RAYS
+
+
+def _sliding_moves(piece, rays, legal_moves, grid):
+    """
+    Generate the moves of a bishop, rook or queen.
+
+    Each ray runs until the edge of the board or the first piece,
+    which is included as a capture when it belongs to the enemy.
+
+    Args:
+        piece (Piece): The sliding piece
+        rays (tuple): Ray walkers from RAYS to slide along
+        legal_moves (list): List the uci strings are appended to
+        grid (list): 8x8 grid of Piece objects or None
+
+    Returns:
+        list: [uci strings]
+    """
+    # Hoist attribute lookups out of the ray loops
+    row, col = piece.row, piece.col
+    color_index = piece.color_index
+    to_uci = StaticChessMethods.indices_to_uci
+
+    for ray in rays:
+        ray(row, col, color_index, grid, legal_moves, to_uci)
+
+    return legal_moves
+
 
 class Piece(ABC):
     """
@@ -8,7 +136,18 @@ class Piece(ABC):
     Attributes:
         piece_type (str): Type of piece ('king', 'queen', 'rook', 'bishop', 'knight', 'pawn')
         color (str): Color of piece ('white' or 'black')
+        color_index (int): 0 for white, 1 for black (Color)
+        type_index (int): Index of the piece type (PieceType)
+        SYMBOLS (tuple): (white, black) display characters, set by each subclass
     """
+
+    # Set by each subclass as class attributes, read without a property call.
+    # type_index is the PieceType value, used for indexing instead of the string
+    piece_type = None
+    type_index = None
+
+    # No per-instance __dict__, attributes live in fixed slots
+    __slots__ = ('color', 'color_index', 'row', 'col', 'grid')
     
     def __init__(self, color, rank, file, grid):
         """
@@ -20,18 +159,14 @@ class Piece(ABC):
             col (int): The the index of the pieces column
             board (Board): The board game object
         """
-        self.color = color
+        self.color_index = COLOR_INDEX[color]
+        self.color = COLOR_NAMES[self.color_index]
         self.row = rank
         self.col = file
         self.grid = grid
     
-    @property
     @abstractmethod
-    def piece_type(self):
-        pass
-
-    @abstractmethod
-    def get_legal_moves(self):
+    def get_legal_moves(self, out=None, grid=None):
         pass
 
     def get_uci_pos(self):
@@ -58,111 +193,119 @@ class Piece(ABC):
         Returns:
             str: Single character representing the piece
         """
-        # Map piece types to their display characters
-        piece_chars = {
-            'king': 'k',
-            'queen': 'q',
-            'rook': 'r',
-            'bishop': 'b',
-            'knight': 'n',
-            'pawn': 'p'
-        }
-        
-        # Get the character for this piece type
-        char = piece_chars[self.piece_type]
-        
-        # Return uppercase for white, lowercase for black
-        return char.upper() if self.color == 'white' else char
+        return self.SYMBOLS[self.color_index]
 
     def __repr__(self):
         return str(self)
 
 class Pawn(Piece):
+    __slots__ = ('direction', 'starting_row', 'promotion_row')
+    piece_type = 'pawn'
+    type_index = int(PieceType.PAWN)
+    # Display characters indexed by color_index, white first
+    SYMBOLS = ('P', 'p')
+
     def __init__(self, color, row, col, grid):
         super().__init__(color, row, col, grid)
+        # White pawns move up (increasing row), black pawns move down (decreasing row)
+        self.direction = (1, -1)[self.color_index]
+        self.starting_row = (1, 6)[self.color_index]
+        self.promotion_row = (7, 0)[self.color_index]
 
-    @property
-    def piece_type(self):
-        return "pawn"
-
-    def get_legal_moves(self):
+    def get_legal_moves(self, out=None, grid=None):
         """
         Generates a list of potentially legal moves from the pawns perspective.
         Pawns move forward one square (or two from starting position)
         and capture diagonally forward.
 
+        Args:
+            out (list, optional): List to append the moves to instead of a new one
+            grid (list, optional): Grid to generate moves on, defaults to the piece's own grid
+
         Returns:
             list: [uci strings]
         """
         # initalizing an empty list
-        # Determine direction based on color
-        # White pawns move up (increasing row), black pawns move down (decreasing row)
-        legal_moves = []
-        direction = 1 if self.color == "white" else -1
-        starting_row = 1 if self.color == "white" else 6
-
-        # Calculating forward rank index
-        forward_rank = self.row + direction
+        # Direction and starting row are precomputed from the color
+        legal_moves = [] if out is None else out
+        direction = self.direction
+        starting_row = self.starting_row
+
+        # Cache lookups used more than once below
+        if grid is None:
+            grid = self.grid
+        row, col = self.row, self.col
+        color_index = self.color_index
+        to_uci = StaticChessMethods.indices_to_uci
+
+        # Calculating forward rank index and fetching that row of the grid once
+        forward_rank = row + direction
+        forward_squares = grid[forward_rank]
 
         # check to see if a piece is blocking the pawn. Pawns can't capture forwards.
-        if self.grid[forward_rank][self.col] is None:
-            legal_moves.append(StaticChessMethods.indices_to_uci(forward_rank, self.col))
+        if forward_squares[col] is None:
+            legal_moves.append(to_uci(forward_rank, col))
+
+            # Handling double move when the pawn is on its starting sqaure.
+            # Only possible when the square in between is empty as well
+            if row == starting_row:
+                double_rank = forward_rank + direction
+                if grid[double_rank][col] is None:
+                    legal_moves.append(to_uci(double_rank, col))
 
         # Calculating both diagnol indices
-        left_col = self.col - 1
-        right_col  = self.col + 1
+        left_col = col - 1
+        right_col  = col + 1
 
-        # Making sure indices are within the bounds of the columns
-        if left_col >= 0 and left_col <= 7:
+        # Making sure indices are within the bounds of the columns.
+        # left_col can only fall off the left edge and right_col off the right
+        if left_col >= 0:
             # Checking the board to see if there is a piece on that square
-            capture_piece = self.grid[forward_rank][left_col]
-            if isinstance(capture_piece, Piece) and capture_piece.color != self.color:
-                legal_moves.append(StaticChessMethods.indices_to_uci(forward_rank, left_col))
-
-        if right_col >= 0 and right_col <= 7:
-            capture_piece = self.grid[forward_rank][right_col]
-            if isinstance(capture_piece, Piece) and capture_piece.color != self.color:
-                legal_moves.append(StaticChessMethods.indices_to_uci(forward_rank, right_col))
-
-        # Handling double move when the pawn is on its starting sqaure
-        if self.row == starting_row:
-            forward_rank += direction
-            if self.grid[forward_rank][self.col] is None:
-                legal_moves.append(StaticChessMethods.indices_to_uci(forward_rank, self.col))
-        
+            capture_piece = forward_squares[left_col]
+            if capture_piece is not None and capture_piece.color_index != color_index:
+                legal_moves.append(to_uci(forward_rank, left_col))
+
+        if right_col <= 7:
+            capture_piece = forward_squares[right_col]
+            if capture_piece is not None and capture_piece.color_index != color_index:
+                legal_moves.append(to_uci(forward_rank, right_col))
+
         return legal_moves
 
     def copy(self):
         return Pawn(self.color, self.row, self.col, self.grid)
 
 class Knight(Piece):
+    __slots__ = ()
+    piece_type = 'knight'
+    type_index = int(PieceType.KNIGHT)
+    # Display characters indexed by color_index, white first
+    SYMBOLS = ('N', 'n')
+
     def __init__(self, color, row, col, grid):
         super().__init__(color, row, col, grid)
 
-    @property
-    def piece_type(self):
-        return "knight"
-
-    def get_legal_moves(self):
+    def get_legal_moves(self, out=None, grid=None):
         """
         Generates a list of potentially legal moves from the knights perspective.
         knights move and capture in an L shape
 
+        Args:
+            out (list, optional): List to append the moves to instead of a new one
+            grid (list, optional): Grid to generate moves on, defaults to the piece's own grid
+
         Returns:
             list: [uci strings]
         """
 
-        legal_moves = []
-        row_offsets = [-2, -2, -1, -1, 1, 1, 2, 2]
-        col_offsets = [-1, 1, -2, 2, -2, 2, -1, 1]
-        offsets = zip(row_offsets, col_offsets)
-        for row_offset, col_offset in  offsets:
-            cur_row = self.row + row_offset
-            cur_col = self.col + col_offset
-            if cur_row >= 0 and cur_col >= 0 and cur_row <= 7 and cur_col <= 7:
-                capture_piece = self.grid[cur_row][cur_col]
-                if (isinstance(capture_piece, Piece) and capture_piece.color != self.color) or capture_piece is None:
-                    legal_moves.append(StaticChessMethods.indices_to_uci(cur_row, cur_col))
+        legal_moves = [] if out is None else out
+        if grid is None:
+            grid = self.grid
+        color_index = self.color_index
+        for cur_row, cur_col in KNIGHT_TARGETS[self.row * 8 + self.col]:
+            capture_piece = grid[cur_row][cur_col]
+            if capture_piece is None or capture_piece.color_index != color_index:
+                legal_moves.append(StaticChessMethods.indices_to_uci(cur_row, cur_col))
 
         return legal_moves
 
@@ -170,213 +313,143 @@ class Knight(Piece):
         return Knight(self.color, self.row, self.col, self.grid)
 
 class Bishop(Piece):
+    __slots__ = ()
+    piece_type = 'bishop'
+    type_index = int(PieceType.BISHOP)
+    # Display characters indexed by color_index, white first
+    SYMBOLS = ('B', 'b')
+
     def __init__(self, color, row, col, grid):
         super().__init__(color, row, col, grid)
 
-    @property
-    def piece_type(self):
-        return "bishop"
-
-    def get_legal_moves(self):
+    def get_legal_moves(self, out=None, grid=None):
         """
         Generates a list of potentially legal moves from the Bishops perspective.
         Bishops move and capture on the diagnol.
 
+        Args:
+            out (list, optional): List to append the moves to instead of a new one
+            grid (list, optional): Grid to generate moves on, defaults to the piece's own grid
+
         Returns:
             list: [uci strings]
         """
 
-        legal_moves = []
-        forward_directions = [-1, -1, 1, 1]
-        horizontal_directions = [1, -1, 1, -1]
-        directions = zip(forward_directions, horizontal_directions)
-        
-        for forward_direction, horizontal_direction in directions:
-            for i in range(1, 8):
-                cur_row = self.row + i * forward_direction
-                cur_col = self.col + i * horizontal_direction
-
-                if cur_row < 0 or cur_row > 7 or cur_col < 0 or cur_col > 7:
-                    break
-
-                capture_piece = self.grid[cur_row][cur_col]
-                if capture_piece is None:
-                    legal_moves.append(StaticChessMethods.indices_to_uci(cur_row, cur_col))
-                elif isinstance(capture_piece, Piece):
-                    if capture_piece.color != self.color:
-                        legal_moves.append(StaticChessMethods.indices_to_uci(cur_row, cur_col))
-                    break
-
-        return legal_moves
+        legal_moves = [] if out is None else out
+        if grid is None:
+            grid = self.grid
+        return _sliding_moves(self, BISHOP_RAYS, legal_moves, grid)
 
     def copy(self):
         return Bishop(self.color, self.row, self.col, self.grid)
 
 class Rook(Piece):
+    __slots__ = ()
+    piece_type = 'rook'
+    type_index = int(PieceType.ROOK)
+    # Display characters indexed by color_index, white first
+    SYMBOLS = ('R', 'r')
+
     def __init__(self, color, row, col, grid):
         super().__init__(color, row, col, grid)
 
-    @property
-    def piece_type(self):
-        return "rook"
-
-    def get_legal_moves(self):
+    def get_legal_moves(self, out=None, grid=None):
         """
         Generates a list of potentially legal moves from the Rooks perspective.
         Rooks move and capture on the vertical or horizontal.
+
+        Args:
+            out (list, optional): List to append the moves to instead of a new one
+            grid (list, optional): Grid to generate moves on, defaults to the piece's own grid
+
         Returns:
             list: [uci strings]
         """
 
-        legal_moves = []
-        forward_directions = [-1, 1, 0, 0]
-        horizontal_directions = [0, 0, -1, 1]
-        directions = zip(forward_directions, horizontal_directions)
-        
-        for forward_direction, horizontal_direction in directions:
-            for i in range(1, 8):
-                cur_row = self.row + i * forward_direction
-                cur_col = self.col + i * horizontal_direction
-
-                if cur_row < 0 or cur_row > 7 or cur_col < 0 or cur_col > 7:
-                    break
-
-                capture_piece = self.grid[cur_row][cur_col]
-                if capture_piece is None:
-                    legal_moves.append(StaticChessMethods.indices_to_uci(cur_row, cur_col))
-                elif isinstance(capture_piece, Piece):
-                    if capture_piece.color != self.color:
-                        legal_moves.append(StaticChessMethods.indices_to_uci(cur_row, cur_col))
-                    break
-        
-        return legal_moves
+        legal_moves = [] if out is None else out
+        if grid is None:
+            grid = self.grid
+        return _sliding_moves(self, ROOK_RAYS, legal_moves, grid)
 
     def copy(self):
         return Rook(self.color, self.row, self.col, self.grid)
 
 class Queen(Piece):
+    __slots__ = ()
+    piece_type = 'queen'
+    type_index = int(PieceType.QUEEN)
+    # Display characters indexed by color_index, white first
+    SYMBOLS = ('Q', 'q')
+
     def __init__(self, color, row, col, grid):
         super().__init__(color, row, col, grid)
 
-    @property
-    def piece_type(self):
-        return "queen"
-
-    def get_legal_moves(self):
+    def get_legal_moves(self, out=None, grid=None):
         """
         Generates a list of potentially legal moves from the queens perspective.
         Queens move and capture on the vertical, horizontal, or diagnol.
         She has the combinations of the rooks and bishops moves.
+
+        Args:
+            out (list, optional): List to append the moves to instead of a new one
+            grid (list, optional): Grid to generate moves on, defaults to the piece's own grid
+
         Returns:
             list: [uci strings]
         """
 
-        legal_moves = []
-        forward_directions = [-1, 1, 0, 0]
-        horizontal_directions = [0, 0, -1, 1]
-        directions = zip(forward_directions, horizontal_directions)
-        
-        for forward_direction, horizontal_direction in directions:
-            for i in range(1, 8):
-                cur_row = self.row + i * forward_direction
-                cur_col = self.col + i * horizontal_direction
-
-                if cur_row < 0 or cur_row > 7 or cur_col < 0 or cur_col > 7:
-                    break
-
-                capture_piece = self.grid[cur_row][cur_col]
-                if capture_piece is None:
-                    legal_moves.append(StaticChessMethods.indices_to_uci(cur_row, cur_col))
-                elif isinstance(capture_piece, Piece):
-                    if capture_piece.color != self.color:
-                        legal_moves.append(StaticChessMethods.indices_to_uci(cur_row, cur_col))
-                    break
-
-        forward_directions = [-1, -1, 1, 1]
-        horizontal_directions = [1, -1, 1, -1]
-        directions = zip(forward_directions, horizontal_directions)
-        
-        for forward_direction, horizontal_direction in directions:
-            for i in range(1, 8):
-                cur_row = self.row + i * forward_direction
-                cur_col = self.col + i * horizontal_direction
-
-                if cur_row < 0 or cur_row > 7 or cur_col < 0 or cur_col > 7:
-                    break
-
-                capture_piece = self.grid[cur_row][cur_col]
-                if capture_piece is None:
-                    legal_moves.append(StaticChessMethods.indices_to_uci(cur_row, cur_col))
-                elif isinstance(capture_piece, Piece):
-                    if capture_piece.color != self.color:
-                        legal_moves.append(StaticChessMethods.indices_to_uci(cur_row, cur_col))
-                    break
-
-        return legal_moves
+        legal_moves = [] if out is None else out
+        if grid is None:
+            grid = self.grid
+        return _sliding_moves(self, QUEEN_RAYS, legal_moves, grid)
 
     def copy(self):
         return Queen(self.color, self.row, self.col, self.grid)
 
 class King(Piece):
+    __slots__ = ()
+    piece_type = 'king'
+    type_index = int(PieceType.KING)
+    # Display characters indexed by color_index, white first
+    SYMBOLS = ('K', 'k')
+
     def __init__(self, color, row, col, grid):
         super().__init__(color, row, col, grid)
 
-    @property
-    def piece_type(self):
-        return "king"
-
-    def get_legal_moves(self):
+    def get_legal_moves(self, out=None, grid=None):
         """
         Generates a list of potentially legal moves from the kings perspective.
         kings move and capture on the vertical, horizontal, or diagnol but only 1 square.
 
+        Args:
+            out (list, optional): List to append the moves to instead of a new one
+            grid (list, optional): Grid to generate moves on, defaults to the piece's own grid
+
         Returns:
             list: [uci strings]
         """
 
-        legal_moves = []
-        forward_directions = [-1, 1, 0, 0]
-        horizontal_directions = [0, 0, -1, 1]
-        directions = zip(forward_directions, horizontal_directions)
-        
-        for forward_direction, horizontal_direction in directions:
-            for i in range(1, 2):
-                cur_row = self.row + i * forward_direction
-                cur_col = self.col + i * horizontal_direction
-
-                if cur_row < 0 or cur_row > 7 or cur_col < 0 or cur_col > 7:
-                    break
-
-                capture_piece = self.grid[cur_row][cur_col]
-                if capture_piece is None:
-                    legal_moves.append(StaticChessMethods.indices_to_uci(cur_row, cur_col))
-                elif isinstance(capture_piece, Piece):
-                    if capture_piece.color != self.color:
-                        legal_moves.append(StaticChessMethods.indices_to_uci(cur_row, cur_col))
-                    break
-
-        forward_directions = [-1, -1, 1, 1]
-        horizontal_directions = [1, -1, 1, -1]
-        directions = zip(forward_directions, horizontal_directions)
-        
-        for forward_direction, horizontal_direction in directions:
-            for i in range(1, 2):
-                cur_row = self.row + i * forward_direction
-                cur_col = self.col + i * horizontal_direction
-
-                if cur_row < 0 or cur_row > 7 or cur_col < 0 or cur_col > 7:
-                    break
-
-                capture_piece = self.grid[cur_row][cur_col]
-                if capture_piece is None:
-                    legal_moves.append(StaticChessMethods.indices_to_uci(cur_row, cur_col))
-                elif isinstance(capture_piece, Piece):
-                    if capture_piece.color != self.color:
-                        legal_moves.append(StaticChessMethods.indices_to_uci(cur_row, cur_col))
-                    break
+        legal_moves = [] if out is None else out
+        if grid is None:
+            grid = self.grid
+        color_index = self.color_index
+        for cur_row, cur_col in KING_TARGETS[self.row * 8 + self.col]:
+            capture_piece = grid[cur_row][cur_col]
+            if capture_piece is None or capture_piece.color_index != color_index:
+                legal_moves.append(StaticChessMethods.indices_to_uci(cur_row, cur_col))
 
         return legal_moves
 
     def copy(self):
         return King(self.color, self.row, self.col, self.grid)
 
+
+# Piece class for each piece type, used to construct pieces with a single lookup
+PIECE_CLASSES = {
+    'pawn': Pawn,
+    'knight': Knight,
+    'bishop': Bishop,
+    'rook': Rook,
+    'queen': Queen,
+    'king': King,
+}
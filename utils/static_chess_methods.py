@@ -1,3 +1,12 @@
+# Every square name mapped to its (row, col) grid indices and back,
+# built once so conversions are a single lookup instead of parsing
+_FILES = "ABCDEFGH"
+_INDICES_TO_UCI = tuple(
+    tuple(file + str(row + 1) for file in _FILES) for row in range(8)
+)
+_UCI_TO_INDICES = {
+    _INDICES_TO_UCI[row][col]: (row, col) for row in range(8) for col in range(8)
+}
 
 class StaticChessMethods:
     @staticmethod
@@ -11,44 +20,28 @@ class StaticChessMethods:
         Returns:
             tuple: (row, col) indices for the grid, or (None, None) if invalid
         """
-        # Convert to uppercase and strip whitespace
-        position = position.strip().upper()
-        
-        # Check if position is valid format (letter + number)
-        if len(position) != 2:
-            return None, None
-        
-        file_char = position[0]
-        rank_char = position[1]
-        
-        # Validate file (A-H) and rank (1-8)
-        if file_char not in 'ABCDEFGH' or rank_char not in '12345678':
-            return None, None
-        
-        # Convert file letter to column index
-        col = ord(file_char) - ord('A')
-        
-        # Convert rank number to row index
-        row = int(rank_char) - 1
-        
-        return row, col
+        # Names already in the canonical 'E2' form are found directly
+        indices = _UCI_TO_INDICES.get(position)
+        if indices is not None:
+            return indices
+
+        # Convert to uppercase and strip whitespace, anything that isn't
+        # one of the 64 square names is invalid
+        return _UCI_TO_INDICES.get(position.strip().upper(), (None, None))
 
     @staticmethod
     def indices_to_uci(row, col):
         """
-        Convert chess notation (e.g., 'E2') to grid indices.
+        Convert grid indices to chess notation (e.g., 'E2').
         
         Args:
-            position (str): Chess position in format like 'E2', 'a1', etc.
+            row (int): Row index (0-7)
+            col (int): Column index (0-7)
         
         Returns:
-            tuple: (row, col) indices for the grid, or (None, None) if invalid
+            str: Chess position like 'E2'
         """
-        rank = row + 1
-        files = "ABCDEFGH"
-        file = files[col]
-        uci = file + str(rank)
-        return uci
+        return _INDICES_TO_UCI[row][col]
 
 
 
@@ -0,0 +1,65 @@
+"""
+Zobrist hashing.
+
+A position hash is the XOR of one random 64-bit key per (piece, square)
+pair on the board, plus a key for the side to move. Moving a piece only
+needs the old and new square keys XORed in, so hashes can be kept up to
+date in O(1) and two positions compare with a single integer compare.
+
+The keys come from a fixed seed so hashes are the same on every run.
+"""
+import random
+
+from .bitboards import iter_squares
+
+_rng = random.Random(0xC0FFEE)
+
+# Keys indexed by [color * 6 + piece index][square]
+ZOB_PIECE = tuple(
+    tuple(_rng.getrandbits(64) for _ in range(64)) for _ in range(12)
+)
+# White king side, white queen side, black king side, black queen side
+ZOB_CASTLE = tuple(_rng.getrandbits(64) for _ in range(4))
+# File of the en passant square
+ZOB_EP = tuple(_rng.getrandbits(64) for _ in range(8))
+# XORed in when black is to move
+ZOB_STM = _rng.getrandbits(64)
+
+
+def hash_bitboards(bitboards, black_to_move=False):
+    """
+    Compute the hash of a position from scratch.
+
+    Castling and en passant are not part of the game yet, so only
+    the pieces and the side to move contribute to the hash.
+
+    Args:
+        bitboards (list): 12 bitboards indexed by color * 6 + piece index
+        black_to_move (bool): Whether black is the side to move
+
+    Returns:
+        int: 64-bit position hash
+    """
+    position_hash = ZOB_STM if black_to_move else 0
+    for index, bitboard in enumerate(bitboards):
+        keys = ZOB_PIECE[index]
+        for square in iter_squares(bitboard):
+            position_hash ^= keys[square]
+    return position_hash
+
+
+def toggle_piece(position_hash, index, square):
+    """
+    Add or remove one piece from a hash.
+
+    XOR is its own inverse, so the same call places and removes a piece.
+
+    Args:
+        position_hash (int): Current position hash
+        index (int): Bitboard index of the piece (color * 6 + piece index)
+        square (int): Square index (0-63)
+
+    Returns:
+        int: Updated position hash
+    """
+    return position_hash ^ ZOB_PIECE[index][square]